@@ -105,11 +105,10 @@ class BackupManager:
                             zip_path = os.path.join('profile', rel_path)
                             
                             # Add file to zip
-                            zipf.write(file_path, zip_path)
+                            file_hash = self._add_file_to_backup(zipf, file_path, zip_path)
                             
                             # Update metadata
                             file_size = os.path.getsize(file_path)
-                            file_hash = self._calculate_file_hash(file_path)
                             
                             metadata['files'].append({
                                 'path': rel_path,
@@ -137,6 +136,21 @@ class BackupManager:
             logger.error(f"Error creating backup: {str(e)}")
             return None
     
+    def _add_file_to_backup(self, zipf: zipfile.ZipFile, file_path: str, zip_path: str) -> str:
+        """
+        Add a profile file to a backup archive.
+        
+        Args:
+            zipf: Open backup archive
+            file_path: Path to the file
+            zip_path: Path of the file inside the archive
+            
+        Returns:
+            str: Hexadecimal SHA-256 hash of the file
+        """
+        zipf.write(file_path, zip_path)
+        return self._calculate_file_hash(file_path)
+    
     def _calculate_file_hash(self, file_path: str) -> str:
         """
         Calculate SHA-256 hash of a file.
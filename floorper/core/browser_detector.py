@@ -10,12 +10,14 @@ Supports multiple platforms including Windows, Linux, macOS, and other systems.
 """
 
 import os
+import re
 import sys
 import logging
 import glob
 import shutil
 import json
 import sqlite3
+import concurrent.futures
 from pathlib import Path
 from typing import List, Dict, Any, Set, Optional, Tuple
 
@@ -32,6 +34,9 @@ elif sys.platform.startswith("linux"):
 
 from .constants import BROWSERS, PLATFORM
 
+# Version number in "<browser> --version" output
+_VERSION_RE = re.compile(r'(\d+\.\d+(\.\d+)?)')
+
 class BrowserDetector:
     """Detects installed browsers and their profiles across multiple platforms"""
     
@@ -39,8 +44,26 @@ class BrowserDetector:
         """Initialize the browser detector with platform-specific settings"""
         self.logger = logging.getLogger(__name__)
         self.platform = PLATFORM
+        # Browser versions are probed once per detector and reused by later
+        # detect_browsers() calls; create a new detector to probe them again
+        self._version_cache: Dict[str, str] = {}
+        self._home = os.path.expanduser("~")
         self.logger.info(f"Browser detector initialized for platform: {self.platform}")
     
+    def _expand_path(self, path: str) -> str:
+        """
+        Expand a leading "~" using the home directory resolved at init
+        
+        Args:
+            path: Path that may start with "~"
+            
+        Returns:
+            str: Expanded path
+        """
+        if path == "~" or path.startswith("~/"):
+            return self._home + path[1:]
+        return os.path.expanduser(path)
+    
     def detect_browsers(self) -> List[Dict[str, Any]]:
         """
         Detect installed browsers using multiple methods for reliability
@@ -74,19 +97,33 @@ class BrowserDetector:
                 installed_browser_ids.add(critical_browser)
                 self.logger.info(f"Added critical browser: {critical_browser}")
         
-        # Convert browser IDs to full browser information
+        # Convert browser IDs to full browser information; each browser's version
+        # probe and profile scan is independent I/O, so run them concurrently
+        browser_ids = [browser_id for browser_id in installed_browser_ids if browser_id in BROWSERS]
         installed_browsers = []
-        for browser_id in installed_browser_ids:
-            if browser_id in BROWSERS:
-                browser_info = BROWSERS[browser_id].copy()
-                browser_info["id"] = browser_id
-                browser_info["version"] = self._detect_browser_version(browser_id)
-                browser_info["profiles"] = self._detect_browser_profiles(browser_id)
-                installed_browsers.append(browser_info)
+        if browser_ids:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(browser_ids))) as executor:
+                installed_browsers = list(executor.map(self._get_browser_info, browser_ids))
         
         self.logger.info(f"Detected {len(installed_browsers)} browsers")
         return installed_browsers
     
+    def _get_browser_info(self, browser_id: str) -> Dict[str, Any]:
+        """
+        Build the full information for an installed browser
+        
+        Args:
+            browser_id: Browser identifier
+            
+        Returns:
+            Dict[str, Any]: Browser information with version and profiles
+        """
+        browser_info = BROWSERS[browser_id].copy()
+        browser_info["id"] = browser_id
+        browser_info["version"] = self._detect_browser_version(browser_id)
+        browser_info["profiles"] = self._detect_browser_profiles(browser_id)
+        return browser_info
+    
     def _detect_browsers_by_executables(self, installed_browsers: Set[str]) -> None:
         """
         Detect browsers by checking for their executables in PATH
@@ -121,7 +158,7 @@ class BrowserDetector:
                 continue
                 
             for profile_path in browser_info.get("profile_paths", []):
-                expanded_path = os.path.expanduser(profile_path)
+                expanded_path = self._expand_path(profile_path)
                 if os.path.exists(expanded_path):
                     installed_browsers.add(browser_id)
                     self.logger.info(f"Found browser by profile dir: {browser_id} at {expanded_path}")
@@ -161,8 +198,8 @@ class BrowserDetector:
                     self.logger.debug(f"Registry error for {browser_id}: {str(e)}")
         
         # Method: Check for shortcuts in common locations
-        desktop = os.path.expanduser("~/Desktop")
-        start_menu = os.path.expanduser("~/AppData/Roaming/Microsoft/Windows/Start Menu/Programs")
+        desktop = self._expand_path("~/Desktop")
+        start_menu = self._expand_path("~/AppData/Roaming/Microsoft/Windows/Start Menu/Programs")
         
         for location in [desktop, start_menu]:
             if os.path.exists(location):
@@ -210,7 +247,7 @@ class BrowserDetector:
         """
         # Method: Check for .desktop files
         xdg_data_dirs = os.environ.get("XDG_DATA_DIRS", "/usr/local/share:/usr/share")
-        xdg_data_home = os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share"))
+        xdg_data_home = os.environ.get("XDG_DATA_HOME", self._expand_path("~/.local/share"))
         
         desktop_file_locations = [
             f"{xdg_data_home}/applications",
@@ -341,7 +378,23 @@ class BrowserDetector:
     
     def _detect_browser_version(self, browser_id: str) -> str:
         """
-        Detect the version of a specific browser
+        Detect the version of a specific browser, probing it only once
+        
+        Args:
+            browser_id: Browser identifier
+            
+        Returns:
+            str: Browser version or "Unknown"
+        """
+        try:
+            return self._version_cache[browser_id]
+        except KeyError:
+            version = self._version_cache[browser_id] = self._probe_browser_version(browser_id)
+            return version
+    
+    def _probe_browser_version(self, browser_id: str) -> str:
+        """
+        Read the version of a specific browser from the registry or its executable
         
         Args:
             browser_id: Browser identifier
@@ -383,8 +436,7 @@ class BrowserDetector:
                                 # Extract version from output
                                 output = result.stdout.strip()
                                 # Simple extraction, can be improved
-                                import re
-                                version_match = re.search(r'(\d+\.\d+(\.\d+)?)', output)
+                                version_match = _VERSION_RE.search(output)
                                 if version_match:
                                     return version_match.group(1)
                         except Exception:
@@ -413,7 +465,7 @@ class BrowserDetector:
         
         # Check each potential profile path
         for profile_path in browser_info.get("profile_paths", []):
-            expanded_path = os.path.expanduser(profile_path)
+            expanded_path = self._expand_path(profile_path)
             if not os.path.exists(expanded_path):
                 continue
             
@@ -522,62 +574,93 @@ class BrowserDetector:
             "extensions": 0
         }
         
+        counters = (
+            self._count_firefox_places,
+            self._count_firefox_passwords,
+            self._count_firefox_cookies,
+            self._count_firefox_extensions,
+        )
+        
         try:
-            # Count bookmarks and history from places.sqlite
-            places_db = os.path.join(profile_path, "places.sqlite")
-            if os.path.exists(places_db):
-                try:
-                    conn = sqlite3.connect(f"file:{places_db}?mode=ro", uri=True)
-                    cursor = conn.cursor()
-                    
-                    # Count bookmarks
-                    cursor.execute("SELECT COUNT(*) FROM moz_bookmarks")
-                    stats["bookmarks"] = cursor.fetchone()[0]
-                    
-                    # Count history
-                    cursor.execute("SELECT COUNT(*) FROM moz_places")
-                    stats["history"] = cursor.fetchone()[0]
-                    
-                    conn.close()
-                except Exception as e:
-                    self.logger.debug(f"Error reading places.sqlite: {str(e)}")
-            
-            # Count passwords
-            logins_json = os.path.join(profile_path, "logins.json")
-            if os.path.exists(logins_json):
-                try:
-                    with open(logins_json, "r") as f:
-                        logins_data = json.load(f)
-                        stats["passwords"] = len(logins_data.get("logins", []))
-                except Exception as e:
-                    self.logger.debug(f"Error reading logins.json: {str(e)}")
-            
-            # Count cookies
-            cookies_db = os.path.join(profile_path, "cookies.sqlite")
-            if os.path.exists(cookies_db):
-                try:
-                    conn = sqlite3.connect(f"file:{cookies_db}?mode=ro", uri=True)
-                    cursor = conn.cursor()
-                    
-                    cursor.execute("SELECT COUNT(*) FROM moz_cookies")
-                    stats["cookies"] = cursor.fetchone()[0]
-                    
-                    conn.close()
-                except Exception as e:
-                    self.logger.debug(f"Error reading cookies.sqlite: {str(e)}")
+            # List the profile once so the counters skip absent files without a stat each
+            with os.scandir(profile_path) as entries:
+                present = {entry.name: entry for entry in entries}
             
-            # Count extensions
-            extensions_dir = os.path.join(profile_path, "extensions")
-            if os.path.exists(extensions_dir):
-                try:
-                    stats["extensions"] = len(os.listdir(extensions_dir))
-                except Exception as e:
-                    self.logger.debug(f"Error counting extensions: {str(e)}")
+            for counter in counters:
+                stats.update(counter(profile_path, present))
         except Exception as e:
             self.logger.debug(f"Error getting Firefox profile stats: {str(e)}")
         
         return stats
     
+    def _count_firefox_places(self, profile_path: str, present: Dict[str, os.DirEntry]) -> Dict[str, int]:
+        """Count bookmarks and history from places.sqlite"""
+        if "places.sqlite" not in present:
+            return {}
+        places_db = present["places.sqlite"].path
+        
+        try:
+            conn = sqlite3.connect(f"file:{places_db}?mode=ro", uri=True)
+            try:
+                cursor = conn.cursor()
+                
+                # Count bookmarks and history in a single statement
+                cursor.execute(
+                    "SELECT (SELECT COUNT(*) FROM moz_bookmarks), "
+                    "(SELECT COUNT(*) FROM moz_places)"
+                )
+                bookmarks, history = cursor.fetchone()
+            finally:
+                conn.close()
+            return {"bookmarks": bookmarks, "history": history}
+        except Exception as e:
+            self.logger.debug(f"Error reading places.sqlite: {str(e)}")
+            return {}
+    
+    def _count_firefox_passwords(self, profile_path: str, present: Dict[str, os.DirEntry]) -> Dict[str, int]:
+        """Count saved passwords from logins.json"""
+        if "logins.json" not in present:
+            return {}
+        logins_json = present["logins.json"].path
+        
+        try:
+            with open(logins_json, "r") as f:
+                logins_data = json.load(f)
+            return {"passwords": len(logins_data.get("logins", []))}
+        except Exception as e:
+            self.logger.debug(f"Error reading logins.json: {str(e)}")
+            return {}
+    
+    def _count_firefox_cookies(self, profile_path: str, present: Dict[str, os.DirEntry]) -> Dict[str, int]:
+        """Count cookies from cookies.sqlite"""
+        if "cookies.sqlite" not in present:
+            return {}
+        cookies_db = present["cookies.sqlite"].path
+        
+        try:
+            conn = sqlite3.connect(f"file:{cookies_db}?mode=ro", uri=True)
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM moz_cookies")
+                cookies = cursor.fetchone()[0]
+            finally:
+                conn.close()
+            return {"cookies": cookies}
+        except Exception as e:
+            self.logger.debug(f"Error reading cookies.sqlite: {str(e)}")
+            return {}
+    
+    def _count_firefox_extensions(self, profile_path: str, present: Dict[str, os.DirEntry]) -> Dict[str, int]:
+        """Count installed extensions"""
+        if "extensions" not in present:
+            return {}
+        
+        try:
+            return {"extensions": len(os.listdir(present["extensions"].path))}
+        except Exception as e:
+            self.logger.debug(f"Error counting extensions: {str(e)}")
+            return {}
+    
     def _detect_chrome_profiles(self, base_path: str, browser_id: str) -> List[Dict[str, Any]]:
         """
         Detect Chrome-based browser profiles
@@ -626,22 +709,28 @@ class BrowserDetector:
             
             # Check for profile directories directly if Local State parsing failed
             if not profiles:
-                for item in os.listdir(base_path):
-                    full_path = os.path.join(base_path, item)
+                with os.scandir(base_path) as entries:
+                    candidates = [
+                        entry for entry in entries
+                        if (entry.name == "Default" or entry.name.startswith("Profile")) and entry.is_dir()
+                    ]
+                
+                for entry in candidates:
+                    item = entry.name
+                    full_path = entry.path
                     
-                    if os.path.isdir(full_path) and (item == "Default" or item.startswith("Profile")):
-                        is_default = item == "Default"
-                        name = "Default" if is_default else f"Profile {item.split('Profile ')[-1]}"
-                        
-                        profile_data = {
-                            "id": f"{browser_id}_{item}",
-                            "name": name,
-                            "path": full_path,
-                            "browser_id": browser_id,
-                            "is_default": is_default,
-                            "stats": self._get_chrome_profile_stats(full_path)
-                        }
-                        profiles.append(profile_data)
+                    is_default = item == "Default"
+                    name = "Default" if is_default else f"Profile {item.split('Profile ')[-1]}"
+                    
+                    profile_data = {
+                        "id": f"{browser_id}_{item}",
+                        "name": name,
+                        "path": full_path,
+                        "browser_id": browser_id,
+                        "is_default": is_default,
+                        "stats": self._get_chrome_profile_stats(full_path)
+                    }
+                    profiles.append(profile_data)
         except Exception as e:
             self.logger.debug(f"Error detecting Chrome profiles: {str(e)}")
         
@@ -153,6 +153,24 @@ class ProfileMigrator:
         
         return results
     
+    def _get_data_types(self) -> Dict[str, Any]:
+        """
+        Get the data types that can be migrated.
+        
+        Returns:
+            Dict[str, Any]: Data type definitions keyed by data type
+        """
+        return DATA_TYPES
+    
+    def _get_browsers(self) -> Dict[str, Any]:
+        """
+        Get the supported browsers.
+        
+        Returns:
+            Dict[str, Any]: Browser definitions keyed by browser ID
+        """
+        return BROWSERS
+    
     def _validate_profile(self, profile: Dict[str, Any]) -> bool:
         """
         Validate a profile dictionary.
@@ -267,18 +285,7 @@ class ProfileMigrator:
                             os.makedirs(target_dir, exist_ok=True)
                         
                         # Copy directory contents
-                        for item in os.listdir(source_dir):
-                            source_item = os.path.join(source_dir, item)
-                            target_item = os.path.join(target_dir, item)
-                            
-                            if os.path.isfile(source_item):
-                                if os.path.exists(target_item) and options["merge_strategy"] != "overwrite":
-                                    # Skip existing files unless overwrite is specified
-                                    continue
-                                
-                                shutil.copy2(source_item, target_item)
-                                result["migrated_items"] += 1
-                                result["details"].append(f"Copied {item}")
+                        self._copy_directory_files(source_dir, target_dir, options, result)
                         
                         logger.info(f"Migrated directory: {file_pattern}")
                     except Exception as e:
@@ -407,6 +414,59 @@ class ProfileMigrator:
         
         return result
     
+    def _list_directory_copies(
+        self,
+        source_dir: str,
+        target_dir: str,
+        options: Dict[str, Any]
+    ) -> List[Tuple[str, str, str]]:
+        """
+        List the files of a directory that should be copied during migration.
+        
+        Args:
+            source_dir: Source directory
+            target_dir: Target directory
+            options: Migration options
+            
+        Returns:
+            List[Tuple[str, str, str]]: (name, source path, target path) per file
+        """
+        copies = []
+        
+        for item in os.listdir(source_dir):
+            source_item = os.path.join(source_dir, item)
+            target_item = os.path.join(target_dir, item)
+            
+            if os.path.isfile(source_item):
+                if os.path.exists(target_item) and options["merge_strategy"] != "overwrite":
+                    # Skip existing files unless overwrite is specified
+                    continue
+                
+                copies.append((item, source_item, target_item))
+        
+        return copies
+    
+    def _copy_directory_files(
+        self,
+        source_dir: str,
+        target_dir: str,
+        options: Dict[str, Any],
+        result: Dict[str, Any]
+    ) -> None:
+        """
+        Copy the files of a directory into the target profile.
+        
+        Args:
+            source_dir: Source directory
+            target_dir: Target directory
+            options: Migration options
+            result: Migration result to update
+        """
+        for item, source_item, target_item in self._list_directory_copies(source_dir, target_dir, options):
+            shutil.copy2(source_item, target_item)
+            result["migrated_items"] += 1
+            result["details"].append(f"Copied {item}")
+    
     def _migrate_places_database(self, source_file: str, target_file: str, options: Dict[str, Any]) -> Dict[str, Any]:
         """
         Migrate Firefox places database (bookmarks and history).
@@ -8,16 +8,18 @@ Features beautiful animations, themes, and a responsive design.
 import os
 import sys
 import logging
+import threading
 import time
-from typing import Dict, List, Optional, Any, Tuple, Union
+import functools
+import types
+from typing import Dict, List, Optional, Any, Tuple, Union, Callable, Hashable
 from pathlib import Path
 
 from textual.app import App, ComposeResult
-from textual.containers import Container, Horizontal, Vertical, Grid, ScrollableContainer
+from textual.containers import Container, Horizontal, ScrollableContainer
 from textual.widgets import (
-    Button, Header, Footer, Static, Label, Select, ProgressBar, Checkbox,
-    Input, RadioSet, RadioButton, Switch, Tree, TabbedContent, TabPane,
-    DataTable, Rule, LoadingIndicator, Markdown
+    Button, Header, Footer, Static, Label, ProgressBar, Checkbox,
+    LoadingIndicator, SelectionList
 )
 from textual.screen import Screen
 from textual.binding import Binding
@@ -26,14 +28,6 @@ from textual.widget import Widget
 from textual import events
 from textual.css.query import NoMatches
 from textual import work
-from rich.text import Text
-from rich.console import RenderableType
-from rich.style import Style
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.syntax import Syntax
-from rich.table import Table
-from rich.markdown import Markdown as RichMarkdown
 
 # Import local modules
 from floorper.core import BrowserDetector, ProfileMigrator
@@ -48,6 +42,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger('floorper.tui')
 
+@functools.lru_cache(maxsize=1)
+def _floorp_profiles_cached() -> Tuple[Dict[str, Any], ...]:
+    """Return the detected Floorp profiles, scanning the filesystem only once.
+
+    Call ``_floorp_profiles_cached.cache_clear()`` to force a rescan.
+    """
+    return tuple(get_floorp_profiles())
+
+# Interned log levels, reused as CSS classes on every log line
+_LVL_INFO = sys.intern("info")
+_LVL_SUCCESS = sys.intern("success")
+_LVL_WARNING = sys.intern("warning")
+_LVL_ERROR = sys.intern("error")
+
+# Shared detector instance, reused by all screens instead of rebuilding it on
+# every navigation. Scans keep no state between them except the detector's
+# browser version cache, so versions are probed once per session and a
+# Refresh re-scans profiles but not versions.
+_DETECTOR = BrowserDetector()
+
 # Theme definitions
 THEMES = {
     "dark": {
@@ -112,6 +126,9 @@ THEMES = {
     }
 }
 
+# Freeze the theme table so it can be shared module-wide without copies
+THEMES = types.MappingProxyType({name: types.MappingProxyType(colors) for name, colors in THEMES.items()})
+
 class AnimatedLogo(Static):
     """An animated Floorper logo widget."""
     
@@ -129,11 +146,11 @@ class AnimatedLogo(Static):
         """Initialize the animated logo."""
         super().__init__()
         self.frame = 0
-        self.frames = [
+        self.frames = (
             "╔═╗╦  ╔═╗╔═╗╦═╗╔═╗╔═╗╦═╗",
             "╠╣ ║  ║ ║║ ║╠╦╝╠═╝║╣ ╠╦╝",
             "╚  ╩═╝╚═╝╚═╝╩╚═╩  ╚═╝╩╚═"
-        ]
+        )
         self.animation_speed = 0.5  # seconds per frame
         self.last_update = time.time()
     
@@ -439,6 +456,25 @@ class ProfileCard(Static):
             self.profile_id = profile_id
             self.selected = selected
 
+class FloorpProfileOption(Container):
+    """A selectable container representing a Floorp profile."""
+    
+    def __init__(self, profile: Dict[str, Any], index: int):
+        """Initialize the profile option.
+        
+        Args:
+            profile: Floorp profile information
+            index: Position of the profile in the option list
+        """
+        super().__init__(
+            Static(f"Name: {profile['name']}", classes="profile-name"),
+            Static(f"Path: {profile['path']}", classes="profile-path"),
+            classes="profile-option",
+            id=f"profile-{index}"
+        )
+        self.profile = profile
+        self.index = index
+
 class WelcomeScreen(Screen):
     """Welcome screen for the application."""
     
@@ -448,59 +484,7 @@ class WelcomeScreen(Screen):
         Binding("t", "toggle_theme", "Toggle Theme"),
     ]
     
-    DEFAULT_CSS = """
-    WelcomeScreen {
-        background: $background;
-        color: $text;
-    }
-    
-    #welcome-container {
-        width: 100%;
-        height: 100%;
-        align: center middle;
-    }
-    
-    #welcome-panel {
-        width: 80%;
-        height: auto;
-        background: $surface;
-        border: solid $primary;
-        padding: 2;
-    }
-    
-    #welcome-title {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        text-style: bold;
-        color: $primary;
-        margin-bottom: 1;
-    }
-    
-    #welcome-subtitle {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        color: $secondary;
-        margin-bottom: 2;
-    }
-    
-    #welcome-description {
-        width: 100%;
-        height: auto;
-        margin-bottom: 2;
-    }
-    
-    #welcome-buttons {
-        width: 100%;
-        height: auto;
-        align: center middle;
-    }
-    
-    Button {
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "styles/welcome.tcss"
     
     def compose(self) -> ComposeResult:
         """Compose the screen."""
@@ -567,73 +551,12 @@ class BrowserDetectionScreen(Screen):
         Binding("c", "clear_all", "Clear All"),
     ]
     
-    DEFAULT_CSS = """
-    BrowserDetectionScreen {
-        background: $background;
-        color: $text;
-    }
-    
-    #main-container {
-        width: 100%;
-        height: 100%;
-        padding: 1 2;
-    }
-    
-    #title {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        text-style: bold;
-        color: $primary;
-        margin-bottom: 1;
-    }
-    
-    #subtitle {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        color: $secondary;
-        margin-bottom: 2;
-    }
-    
-    #browser-list {
-        width: 100%;
-        height: 1fr;
-        overflow-y: auto;
-        margin-bottom: 2;
-    }
-    
-    #button-row {
-        width: 100%;
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-    
-    Button {
-        margin: 0 1;
-    }
-    
-    .empty-message {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        color: $text-muted;
-        text-style: italic;
-        margin: 2 0;
-    }
-    
-    #loading-container {
-        width: 100%;
-        height: 100%;
-        align: center middle;
-    }
-    """
+    CSS_PATH = "styles/browser_detection.tcss"
     
     def __init__(self):
         """Initialize the screen."""
         super().__init__()
-        self.detector = BrowserDetector()
+        self.detector = _DETECTOR
         self.selected_browsers = {}
         self.is_loading = True
     
@@ -741,18 +664,20 @@ class BrowserDetectionScreen(Screen):
         if self.is_loading:
             return
         
-        for card in self.query(BrowserCard):
-            checkbox = card.query_one(Checkbox)
-            checkbox.value = True
+        # Coalesce the resulting refreshes into a single frame
+        with self.app.batch_update():
+            for checkbox in self.query("#browser-list Checkbox"):
+                checkbox.value = True
     
     def action_clear_all(self) -> None:
         """Clear all browser selections."""
         if self.is_loading:
             return
         
-        for card in self.query(BrowserCard):
-            checkbox = card.query_one(Checkbox)
-            checkbox.value = False
+        # Coalesce the resulting refreshes into a single frame
+        with self.app.batch_update():
+            for checkbox in self.query("#browser-list Checkbox"):
+                checkbox.value = False
     
     def action_next(self) -> None:
         """Proceed to the next screen."""
@@ -782,68 +707,7 @@ class ProfileSelectionScreen(Screen):
         Binding("c", "clear_all", "Clear All"),
     ]
     
-    DEFAULT_CSS = """
-    ProfileSelectionScreen {
-        background: $background;
-        color: $text;
-    }
-    
-    #main-container {
-        width: 100%;
-        height: 100%;
-        padding: 1 2;
-    }
-    
-    #title {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        text-style: bold;
-        color: $primary;
-        margin-bottom: 1;
-    }
-    
-    #subtitle {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        color: $secondary;
-        margin-bottom: 2;
-    }
-    
-    #profile-list {
-        width: 100%;
-        height: 1fr;
-        overflow-y: auto;
-        margin-bottom: 2;
-    }
-    
-    #button-row {
-        width: 100%;
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-    
-    Button {
-        margin: 0 1;
-    }
-    
-    .empty-message {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        color: $text-muted;
-        text-style: italic;
-        margin: 2 0;
-    }
-    
-    #loading-container {
-        width: 100%;
-        height: 100%;
-        align: center middle;
-    }
-    """
+    CSS_PATH = "styles/profile_selection.tcss"
     
     def __init__(self, selected_browsers: List[str]):
         """Initialize the screen.
@@ -853,7 +717,7 @@ class ProfileSelectionScreen(Screen):
         """
         super().__init__()
         self.selected_browsers = selected_browsers
-        self.detector = BrowserDetector()
+        self.detector = _DETECTOR
         self.selected_profiles = {}
         self.is_loading = True
     
@@ -895,44 +759,52 @@ class ProfileSelectionScreen(Screen):
         except NoMatches:
             return
         
-        # Detect profiles for selected browsers
-        all_profiles = []
+        # Clear existing profile cards before streaming in new ones
+        def clear_cards():
+            for child in profile_list.children:
+                if isinstance(child, ProfileCard):
+                    child.remove()
+        
+        self.call_from_thread(clear_cards)
+        
+        # Detect profiles browser by browser, mounting each batch as it arrives
+        first_call = True
+        found_any = False
         
         for browser_id in self.selected_browsers:
             profiles = self.detector.get_profiles(browser_id)
+            if not profiles:
+                continue
             
+            cards = []
             for profile in profiles:
                 profile['browser_id'] = browser_id
-                all_profiles.append(profile)
-        
-        # Update UI in main thread
-        def update_ui():
-            # Remove loading container
-            loading_container.remove()
+                profile_id = f"{browser_id}:{profile.get('id', '')}"
+                cards.append(ProfileCard(
+                    profile_id=profile_id,
+                    profile_name=f"{profile.get('name', '')} ({browser_id})",
+                    profile_path=profile.get('path', '')
+                ))
             
-            # Clear existing profile cards
-            for child in profile_list.children:
-                if isinstance(child, ProfileCard):
-                    child.remove()
+            def mount_cards(cards=cards, remove_loading=first_call):
+                if remove_loading:
+                    loading_container.remove()
+                profile_list.mount(*cards)
             
-            if not all_profiles:
+            self.call_from_thread(mount_cards)
+            first_call = False
+            found_any = True
+        
+        # Update UI in main thread
+        def finish_ui():
+            if not found_any:
+                loading_container.remove()
                 profile_list.mount(Static("No profiles detected.", classes="empty-message"))
-                return
-            
-            # Add profile cards
-            for profile in all_profiles:
-                profile_id = f"{profile['browser_id']}:{profile.get('id', '')}"
-                card = ProfileCard(
-                    profile_id=profile_id,
-                    profile_name=f"{profile.get('name', '')} ({profile['browser_id']})",
-                    profile_path=profile.get('path', '')
-                )
-                profile_list.mount(card)
             
             self.is_loading = False
         
         # Schedule UI update on main thread
-        self.call_from_thread(update_ui)
+        self.call_from_thread(finish_ui)
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
@@ -961,6 +833,7 @@ class ProfileSelectionScreen(Screen):
     def action_refresh(self) -> None:
         """Refresh the profile list."""
         if not self.is_loading:
+            _floorp_profiles_cached.cache_clear()
             self.detect_profiles()
     
     def action_select_all(self) -> None:
@@ -968,18 +841,20 @@ class ProfileSelectionScreen(Screen):
         if self.is_loading:
             return
         
-        for card in self.query(ProfileCard):
-            checkbox = card.query_one(Checkbox)
-            checkbox.value = True
+        # Coalesce the resulting refreshes into a single frame
+        with self.app.batch_update():
+            for checkbox in self.query("#profile-list Checkbox"):
+                checkbox.value = True
     
     def action_clear_all(self) -> None:
         """Clear all profile selections."""
         if self.is_loading:
             return
         
-        for card in self.query(ProfileCard):
-            checkbox = card.query_one(Checkbox)
-            checkbox.value = False
+        # Coalesce the resulting refreshes into a single frame
+        with self.app.batch_update():
+            for checkbox in self.query("#profile-list Checkbox"):
+                checkbox.value = False
     
     def action_next(self) -> None:
         """Proceed to the next screen."""
@@ -990,18 +865,20 @@ class ProfileSelectionScreen(Screen):
             self.notify("Please select at least one profile.", severity="error")
             return
         
-        # Get Floorp profiles
-        floorp_profiles = get_floorp_profiles()
+        # Get Floorp profiles (cached; cleared on refresh)
+        floorp_profiles = list(_floorp_profiles_cached())
         
         if not floorp_profiles:
             self.notify("No Floorp profiles detected. Please install Floorp first.", severity="error")
             return
         
         # Pass selected profiles to the next screen
-        self.app.push_screen(FloorpProfileSelectionScreen(
-            list(self.selected_profiles.keys()),
-            floorp_profiles
-        ))
+        selected_profiles = list(self.selected_profiles.keys())
+        self.app.push_cached_screen(
+            "floorp-profiles",
+            (tuple(selected_profiles), tuple(profile['path'] for profile in floorp_profiles)),
+            lambda: FloorpProfileSelectionScreen(selected_profiles, floorp_profiles)
+        )
     
     def action_quit(self) -> None:
         """Quit the application."""
@@ -1016,79 +893,9 @@ class FloorpProfileSelectionScreen(Screen):
         Binding("n", "next", "Next"),
     ]
     
-    DEFAULT_CSS = """
-    FloorpProfileSelectionScreen {
-        background: $background;
-        color: $text;
-    }
-    
-    #main-container {
-        width: 100%;
-        height: 100%;
-        padding: 1 2;
-    }
-    
-    #title {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        text-style: bold;
-        color: $primary;
-        margin-bottom: 1;
-    }
-    
-    #subtitle {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        color: $secondary;
-        margin-bottom: 2;
-    }
-    
-    #floorp-profile-list {
-        width: 100%;
-        height: auto;
-        margin-bottom: 2;
-    }
-    
-    #button-row {
-        width: 100%;
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-    
-    Button {
-        margin: 0 1;
-    }
-    
-    .profile-option {
-        width: 100%;
-        height: auto;
-        min-height: 3;
-        padding: 1;
-        background: $surface;
-        border: solid $border;
-        margin-bottom: 1;
-    }
-    
-    .profile-option:hover {
-        border: solid $primary;
-    }
-    
-    .profile-option-selected {
-        border: solid $primary 2;
-    }
-    
-    .profile-name {
-        text-style: bold;
-        color: $primary;
-    }
+    CSS_PATH = "styles/floorp_profile_selection.tcss"
     
-    .profile-path {
-        color: $text-muted;
-    }
-    """
+    selected_index = reactive(-1)
     
     def __init__(self, selected_profiles: List[str], floorp_profiles: List[Dict[str, Any]]):
         """Initialize the screen.
@@ -1101,6 +908,7 @@ class FloorpProfileSelectionScreen(Screen):
         self.selected_profiles = selected_profiles
         self.floorp_profiles = floorp_profiles
         self.selected_floorp_profile = None
+        self._profile_containers: Dict[str, FloorpProfileOption] = {}
     
     def compose(self) -> ComposeResult:
         """Compose the screen."""
@@ -1128,29 +936,42 @@ class FloorpProfileSelectionScreen(Screen):
         """Show Floorp profiles."""
         # Clear existing profile options
         profile_list = self.query_one("#floorp-profile-list")
-        profile_list.remove_children()
+        if profile_list.children:
+            profile_list.remove_children()
+        self.selected_index = -1
+        self._profile_containers.clear()
         
-        # Add profile options
+        # Build profile options and mount them in a single pass
+        widgets = []
         for i, profile in enumerate(self.floorp_profiles):
-            with Container(classes="profile-option", id=f"profile-{i}"):
-                yield Static(f"Name: {profile['name']}", classes="profile-name")
-                yield Static(f"Path: {profile['path']}", classes="profile-path")
-    
-    def on_container_click(self, event: Container.Clicked) -> None:
-        """Handle container click events."""
-        if isinstance(event.container, Container) and event.container.id and event.container.id.startswith("profile-"):
-            # Get profile index
-            profile_index = int(event.container.id.split("-")[1])
-            
-            # Update selected profile
-            self.selected_floorp_profile = self.floorp_profiles[profile_index]['path']
-            
-            # Update UI
-            for container in self.query(".profile-option"):
-                if container.id == event.container.id:
-                    container.add_class("profile-option-selected")
-                else:
-                    container.remove_class("profile-option-selected")
+            container = FloorpProfileOption(profile, i)
+            self._profile_containers[container.id] = container
+            widgets.append(container)
+        
+        profile_list.mount_all(widgets)
+    
+    def on_click(self, event: events.Click) -> None:
+        """Handle clicks delegated from the Floorp profile list."""
+        option = next(
+            (node for node in event.widget.ancestors_with_self if isinstance(node, FloorpProfileOption)),
+            None
+        )
+        if option is None:
+            return
+        
+        # Update selected profile; the watcher restyles the affected options
+        self.selected_floorp_profile = option.profile['path']
+        self.selected_index = option.index
+    
+    def watch_selected_index(self, old_index: int, new_index: int) -> None:
+        """Move the selected state from the old option to the new one."""
+        old_option = self._profile_containers.get(f"profile-{old_index}")
+        if old_option is not None:
+            old_option.remove_class("-selected")
+        
+        new_option = self._profile_containers.get(f"profile-{new_index}")
+        if new_option is not None:
+            new_option.add_class("-selected")
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
@@ -1170,10 +991,11 @@ class FloorpProfileSelectionScreen(Screen):
             return
         
         # Pass selected profiles and Floorp profile to the next screen
-        self.app.push_screen(MigrationOptionsScreen(
-            self.selected_profiles,
-            self.selected_floorp_profile
-        ))
+        self.app.push_cached_screen(
+            "options",
+            (tuple(self.selected_profiles), self.selected_floorp_profile),
+            lambda: MigrationOptionsScreen(self.selected_profiles, self.selected_floorp_profile)
+        )
     
     def action_quit(self) -> None:
         """Quit the application."""
@@ -1188,89 +1010,28 @@ class MigrationOptionsScreen(Screen):
         Binding("n", "next", "Next"),
     ]
     
-    DEFAULT_CSS = """
-    MigrationOptionsScreen {
-        background: $background;
-        color: $text;
-    }
-    
-    #main-container {
-        width: 100%;
-        height: 100%;
-        padding: 1 2;
-    }
-    
-    #title {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        text-style: bold;
-        color: $primary;
-        margin-bottom: 1;
-    }
-    
-    #subtitle {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        color: $secondary;
-        margin-bottom: 2;
+    CSS_PATH = "styles/migration_options.tcss"
+    
+    # (label, option key) pairs shown in each SelectionList, by list id
+    SELECTION_GROUPS = {
+        "general-options": (
+            ("Create backup before migration", "backup_before_migration"),
+        ),
+        "data-options": (
+            ("Bookmarks", "migrate_bookmarks"),
+            ("History", "migrate_history"),
+            ("Passwords", "migrate_passwords"),
+            ("Cookies", "migrate_cookies"),
+            ("Extensions", "migrate_extensions"),
+            ("Preferences", "migrate_preferences"),
+        ),
+        "advanced-options": (
+            ("Deduplicate bookmarks", "deduplicate_bookmarks"),
+            ("Deduplicate history", "deduplicate_history"),
+            ("Merge sessions", "merge_sessions"),
+        ),
     }
     
-    #options-container {
-        width: 100%;
-        height: auto;
-        background: $surface;
-        border: solid $border;
-        padding: 1;
-        margin-bottom: 2;
-    }
-    
-    .option-group {
-        width: 100%;
-        height: auto;
-        margin-bottom: 1;
-        padding-bottom: 1;
-        border-bottom: solid $border;
-    }
-    
-    .option-group-title {
-        width: 100%;
-        height: auto;
-        text-style: bold;
-        color: $primary;
-        margin-bottom: 1;
-    }
-    
-    .option-row {
-        width: 100%;
-        height: auto;
-        margin-bottom: 1;
-    }
-    
-    .option-label {
-        width: 70%;
-        height: auto;
-    }
-    
-    .option-control {
-        width: 30%;
-        height: auto;
-        content-align: right middle;
-    }
-    
-    #button-row {
-        width: 100%;
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-    
-    Button {
-        margin: 0 1;
-    }
-    """
-    
     def __init__(self, selected_profiles: List[str], floorp_profile: str):
         """Initialize the screen.
         
@@ -1305,52 +1066,24 @@ class MigrationOptionsScreen(Screen):
             with Container(id="options-container"):
                 with Container(classes="option-group"):
                     yield Static("General Options", classes="option-group-title")
-                    
-                    with Horizontal(classes="option-row"):
-                        yield Static("Create backup before migration", classes="option-label")
-                        yield Switch(value=self.options['backup_before_migration'], id="backup_before_migration", classes="option-control")
+                    yield SelectionList[str](
+                        *((label, key, self.options[key]) for label, key in self.SELECTION_GROUPS["general-options"]),
+                        id="general-options"
+                    )
                 
                 with Container(classes="option-group"):
                     yield Static("Data to Migrate", classes="option-group-title")
-                    
-                    with Horizontal(classes="option-row"):
-                        yield Static("Bookmarks", classes="option-label")
-                        yield Switch(value=self.options['migrate_bookmarks'], id="migrate_bookmarks", classes="option-control")
-                    
-                    with Horizontal(classes="option-row"):
-                        yield Static("History", classes="option-label")
-                        yield Switch(value=self.options['migrate_history'], id="migrate_history", classes="option-control")
-                    
-                    with Horizontal(classes="option-row"):
-                        yield Static("Passwords", classes="option-label")
-                        yield Switch(value=self.options['migrate_passwords'], id="migrate_passwords", classes="option-control")
-                    
-                    with Horizontal(classes="option-row"):
-                        yield Static("Cookies", classes="option-label")
-                        yield Switch(value=self.options['migrate_cookies'], id="migrate_cookies", classes="option-control")
-                    
-                    with Horizontal(classes="option-row"):
-                        yield Static("Extensions", classes="option-label")
-                        yield Switch(value=self.options['migrate_extensions'], id="migrate_extensions", classes="option-control")
-                    
-                    with Horizontal(classes="option-row"):
-                        yield Static("Preferences", classes="option-label")
-                        yield Switch(value=self.options['migrate_preferences'], id="migrate_preferences", classes="option-control")
+                    yield SelectionList[str](
+                        *((label, key, self.options[key]) for label, key in self.SELECTION_GROUPS["data-options"]),
+                        id="data-options"
+                    )
                 
                 with Container(classes="option-group"):
                     yield Static("Advanced Options", classes="option-group-title")
-                    
-                    with Horizontal(classes="option-row"):
-                        yield Static("Deduplicate bookmarks", classes="option-label")
-                        yield Switch(value=self.options['deduplicate_bookmarks'], id="deduplicate_bookmarks", classes="option-control")
-                    
-                    with Horizontal(classes="option-row"):
-                        yield Static("Deduplicate history", classes="option-label")
-                        yield Switch(value=self.options['deduplicate_history'], id="deduplicate_history", classes="option-control")
-                    
-                    with Horizontal(classes="option-row"):
-                        yield Static("Merge sessions", classes="option-label")
-                        yield Switch(value=self.options['merge_sessions'], id="merge_sessions", classes="option-control")
+                    yield SelectionList[str](
+                        *((label, key, self.options[key]) for label, key in self.SELECTION_GROUPS["advanced-options"]),
+                        id="advanced-options"
+                    )
             
             with Horizontal(id="button-row"):
                 yield Button("Back", id="back", variant="primary")
@@ -1358,10 +1091,12 @@ class MigrationOptionsScreen(Screen):
         
         yield Footer()
     
-    def on_switch_changed(self, event: Switch.Changed) -> None:
-        """Handle switch change events."""
-        if event.switch.id in self.options:
-            self.options[event.switch.id] = event.value
+    def on_selection_list_selected_changed(self, event: SelectionList.SelectedChanged) -> None:
+        """Handle selection list change events."""
+        group = self.SELECTION_GROUPS.get(event.selection_list.id, ())
+        selected = set(event.selection_list.selected)
+        for _, key in group:
+            self.options[key] = key in selected
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
@@ -1394,90 +1129,38 @@ class MigrationScreen(Screen):
         Binding("q", "quit", "Quit"),
     ]
     
-    DEFAULT_CSS = """
-    MigrationScreen {
-        background: $background;
-        color: $text;
-    }
+    CSS_PATH = "styles/migration.tcss"
     
-    #main-container {
-        width: 100%;
-        height: 100%;
-        padding: 1 2;
-    }
+    # Shared across migration rounds; created lazily on the worker thread
+    _migrator_singleton: Optional[ProfileMigrator] = None
+    _backup_manager_singleton: Optional[BackupManager] = None
+    _singleton_lock = threading.Lock()
     
-    #title {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        text-style: bold;
-        color: $primary;
-        margin-bottom: 1;
-    }
-    
-    #subtitle {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        color: $secondary;
-        margin-bottom: 2;
-    }
-    
-    #migration-status {
-        width: 100%;
-        height: auto;
-        margin-bottom: 1;
-    }
-    
-    #status-text {
-        width: 100%;
-        height: auto;
-        margin-bottom: 1;
-    }
-    
-    #progress-container {
-        width: 100%;
-        height: auto;
-        margin-bottom: 2;
-    }
-    
-    #migration-log {
-        width: 100%;
-        height: 1fr;
-        background: $surface;
-        border: solid $border;
-        padding: 1;
-        overflow-y: auto;
-        margin-bottom: 2;
-    }
-    
-    #button-row {
-        width: 100%;
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-    
-    Button {
-        margin: 0 1;
-    }
-    
-    .success {
-        color: $success;
-    }
-    
-    .error {
-        color: $error;
-    }
-    
-    .warning {
-        color: $warning;
-    }
-    
-    .info {
-        color: $secondary;
-    }
-    """
+    @classmethod
+    def get_migrator(cls) -> ProfileMigrator:
+        """Get the shared profile migrator, creating it on first use.
+        
+        Returns:
+            Shared ProfileMigrator instance
+        """
+        if cls._migrator_singleton is None:
+            with cls._singleton_lock:
+                if cls._migrator_singleton is None:
+                    cls._migrator_singleton = ProfileMigrator()
+        return cls._migrator_singleton
+    
+    @classmethod
+    def get_backup_manager(cls) -> BackupManager:
+        """Get the shared backup manager, creating it on first use.
+        
+        Returns:
+            Shared BackupManager instance
+        """
+        if cls._backup_manager_singleton is None:
+            with cls._singleton_lock:
+                if cls._backup_manager_singleton is None:
+                    cls._backup_manager_singleton = BackupManager()
+        return cls._backup_manager_singleton
     
     def __init__(self, selected_profiles: List[str], floorp_profile: str, options: Dict[str, bool]):
         """Initialize the screen.
@@ -1491,13 +1174,20 @@ class MigrationScreen(Screen):
         self.selected_profiles = selected_profiles
         self.floorp_profile = floorp_profile
         self.options = options
-        self.migrator = ProfileMigrator()
-        self.backup_manager = BackupManager()
+        self._parsed_profiles: List[Tuple[str, str]] = [
+            tuple(profile_id.split(':', 1)) for profile_id in selected_profiles
+        ]
         self.current_profile_index = 0
         self.migration_successful = False
         self.total_profiles = len(selected_profiles)
         self.current_step = "preparing"
         self.steps = ["preparing", "backup", "migration", "cleanup", "complete"]
+        
+        # Pending log lines, flushed to the log widget in batches
+        self._log_lock = threading.Lock()
+        self._log_queue: List[Tuple[str, Tuple[Any, ...], str]] = []
+        self._log_container: Optional[Widget] = None
+        self._log_flush_scheduled = False
     
     def compose(self) -> ComposeResult:
         """Compose the screen."""
@@ -1525,17 +1215,22 @@ class MigrationScreen(Screen):
     
     def on_mount(self) -> None:
         """Handle the mount event."""
+        # Resolve widget handles once for reuse by the worker
+        self._status_text = self.query_one("#status-text", Static)
+        self._progress = self.query_one("#progress-bar", ProgressBar)
+        self._log = self.query_one("#migration-log", ScrollableContainer)
+        self._finish = self.query_one("#finish", Button)
+        
         # Start migration
         self.start_migration()
     
     def start_migration(self) -> None:
         """Start the migration process."""
         # Update status
-        self.query_one("#status-text").update("Starting migration...")
+        self._status_text.update("Starting migration...")
         
         # Set progress bar
-        progress_bar = self.query_one("#progress-bar")
-        progress_bar.progress = 0
+        self._progress.progress = 0
         
         # Start migration in a worker thread
         self.run_worker(self.migrate_profiles, thread=True)
@@ -1543,54 +1238,53 @@ class MigrationScreen(Screen):
     @work(thread=True)
     async def migrate_profiles(self) -> None:
         """Migrate profiles in a worker thread."""
-        log_container = self.query_one("#migration-log")
-        progress_bar = self.query_one("#progress-bar")
+        log_container = self._log
         
         # Calculate total steps
         total_steps = len(self.steps) + self.total_profiles - 1
-        progress_bar.total = total_steps
+        self.call_from_thread(setattr, self._progress, "total", total_steps)
         current_step = 0
         
         # Log migration start
-        self.log_message(log_container, "Starting migration process...", "info")
+        self.log_message(log_container, "Starting migration process...")
         
         # Create backup if requested
         if self.options.get('backup_before_migration', True):
             self.current_step = "backup"
             current_step += 1
-            progress_bar.progress = current_step
+            self._update_progress(current_step)
             
-            self.call_from_thread(self.query_one("#status-text").update, "Creating backup...")
-            self.log_message(log_container, "Creating backup of Floorp profile...", "info")
+            self.call_from_thread(self._status_text.update, "Creating backup...")
+            self.log_message(log_container, "Creating backup of Floorp profile...")
             
             try:
-                backup_path = self.backup_manager.create_backup(self.floorp_profile)
-                self.log_message(log_container, f"Backup created successfully at: {backup_path}", "success")
+                backup_path = self.get_backup_manager().create_backup(self.floorp_profile)
+                self.log_message(log_container, "Backup created successfully at: {}", backup_path, level=_LVL_SUCCESS)
             except Exception as e:
-                self.log_message(log_container, f"Failed to create backup: {str(e)}", "error")
-                self.log_message(log_container, "Continuing without backup...", "warning")
+                self.log_message(log_container, "Failed to create backup: {}", e, level=_LVL_ERROR)
+                self.log_message(log_container, "Continuing without backup...", level=_LVL_WARNING)
         
-        # Process each profile
+        # Process each profile; they all write into the same Floorp profile
+        # (places.sqlite, cookies.sqlite, logins.json, prefs.js), so they
+        # must run one after another
         self.current_step = "migration"
-        for i, profile_id in enumerate(self.selected_profiles):
+        migrator = self.get_migrator()
+        for i, (browser_id, profile_path) in enumerate(self._parsed_profiles):
             # Update status
             self.current_profile_index = i
             current_step += 1
-            progress_bar.progress = current_step
-            
-            # Parse profile ID
-            browser_id, profile_path = profile_id.split(':', 1)
+            self._update_progress(current_step)
             
             # Update status text
             status_text = f"Migrating profile {i+1}/{self.total_profiles}: {profile_path}"
-            self.call_from_thread(self.query_one("#status-text").update, status_text)
+            self.call_from_thread(self._status_text.update, status_text)
             
             # Log migration start
-            self.log_message(log_container, f"Migrating {browser_id} profile: {profile_path}", "info")
+            self.log_message(log_container, "Migrating {} profile: {}", browser_id, profile_path)
             
             try:
                 # Perform migration
-                result = self.migrator.migrate_profile(
+                result = migrator.migrate_profile(
                     browser_id=browser_id,
                     source_profile=profile_path,
                     target_profile=self.floorp_profile,
@@ -1599,49 +1293,87 @@ class MigrationScreen(Screen):
                 
                 # Log migration result
                 if result.get('success', False):
-                    self.log_message(log_container, f"✓ Successfully migrated {browser_id} profile", "success")
+                    self.log_message(log_container, "✓ Successfully migrated {} profile", browser_id, level=_LVL_SUCCESS)
                     
                     # Log details
                     if 'details' in result:
                         for detail in result['details']:
-                            self.log_message(log_container, f"  - {detail}", "info")
+                            self.log_message(log_container, "  - {}", detail)
                 else:
-                    self.log_message(log_container, f"✗ Failed to migrate {browser_id} profile: {result.get('error', 'Unknown error')}", "error")
+                    self.log_message(log_container, "✗ Failed to migrate {} profile: {}", browser_id, result.get('error', 'Unknown error'), level=_LVL_ERROR)
             except Exception as e:
                 # Log migration error
-                self.log_message(log_container, f"✗ Error migrating {browser_id} profile: {str(e)}", "error")
+                self.log_message(log_container, "✗ Error migrating {} profile: {}", browser_id, e, level=_LVL_ERROR)
         
         # Cleanup
         self.current_step = "cleanup"
         current_step += 1
-        progress_bar.progress = current_step
+        self._update_progress(current_step)
         
-        self.call_from_thread(self.query_one("#status-text").update, "Cleaning up...")
-        self.log_message(log_container, "Performing cleanup...", "info")
+        self.call_from_thread(self._status_text.update, "Cleaning up...")
+        self.log_message(log_container, "Performing cleanup...")
         
         # Complete
         self.current_step = "complete"
-        current_step += 1
-        progress_bar.progress = current_step
+        current_step = total_steps
+        self._update_progress(current_step)
         
-        self.call_from_thread(self.query_one("#status-text").update, "Migration completed")
-        self.log_message(log_container, "Migration process completed successfully!", "success")
+        self.call_from_thread(self._status_text.update, "Migration completed")
+        self.log_message(log_container, "Migration process completed successfully!", level=_LVL_SUCCESS)
         
         # Enable finish button
-        self.call_from_thread(self.query_one("#finish").disabled, False)
+        self.call_from_thread(setattr, self._finish, "disabled", False)
         
         # Set migration as successful
         self.migration_successful = True
     
-    def log_message(self, container: Widget, message: str, level: str = "info") -> None:
+    def _update_progress(self, current_step: int) -> None:
+        """Post a progress bar update to the UI thread.
+        
+        Args:
+            current_step: Completed step count
+        """
+        self.call_from_thread(setattr, self._progress, "progress", current_step)
+    
+    def log_message(self, container: Widget, fmt: str, *args: Any, level: str = _LVL_INFO) -> None:
         """Log a message to the migration log.
         
+        Formatting is deferred until the pending lines are flushed.
+        
         Args:
             container: Container widget to add the message to
-            message: Message text
+            fmt: Message format string, filled with ``str.format``
+            *args: Values for the format string
             level: Message level (info, success, warning, error)
         """
-        self.call_from_thread(container.mount, Static(message, classes=level))
+        with self._log_lock:
+            self._log_container = container
+            self._log_queue.append((fmt, args, level))
+            if self._log_flush_scheduled:
+                return
+            self._log_flush_scheduled = True
+        
+        self.call_from_thread(self._schedule_log_flush)
+    
+    def _schedule_log_flush(self) -> None:
+        """Schedule a flush of pending log lines on the next UI tick."""
+        self.set_timer(0.05, self._flush_log)
+    
+    def _flush_log(self) -> None:
+        """Mount all pending log lines in a single batch."""
+        with self._log_lock:
+            batch, self._log_queue = self._log_queue, []
+            self._log_flush_scheduled = False
+        
+        if batch and self._log_container is not None:
+            # Append-only mounts at the end of the log, then pin the view to
+            # the bottom once the new lines have been laid out
+            container = self._log_container
+            container.mount_all(
+                Static(fmt.format(*args) if args else fmt, classes=level)
+                for fmt, args, level in batch
+            )
+            self.call_after_refresh(container.scroll_end, animate=False)
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
@@ -1669,55 +1401,7 @@ class SummaryScreen(Screen):
         Binding("n", "new", "New Migration"),
     ]
     
-    DEFAULT_CSS = """
-    SummaryScreen {
-        background: $background;
-        color: $text;
-    }
-    
-    #main-container {
-        width: 100%;
-        height: 100%;
-        padding: 1 2;
-    }
-    
-    #title {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        text-style: bold;
-        color: $primary;
-        margin-bottom: 1;
-    }
-    
-    #subtitle {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        color: $secondary;
-        margin-bottom: 2;
-    }
-    
-    #summary-container {
-        width: 100%;
-        height: auto;
-        background: $surface;
-        border: solid $success;
-        padding: 2;
-        margin-bottom: 2;
-    }
-    
-    #button-row {
-        width: 100%;
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-    
-    Button {
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "styles/summary.tcss"
     
     def compose(self) -> ComposeResult:
         """Compose the screen."""
@@ -1769,119 +1453,16 @@ class FloorperTUI(App):
     TITLE = "Floorper - Universal Browser Profile Migration Tool for Floorp"
     SUB_TITLE = "TUI Edition"
     
-    DEFAULT_CSS = """
-    * {
-        transition: background 500ms in_out_cubic, color 500ms in_out_cubic;
-    }
-    
-    Screen {
-        background: $background;
-        color: $text;
-    }
-    
-    LoadingIndicator {
-        color: $primary;
-    }
-    
-    ProgressBar {
-        width: 100%;
-        height: 1;
-    }
-    
-    ProgressBar > .bar {
-        color: $primary 60%;
-    }
-    
-    ProgressBar > .complete {
-        color: $success 60%;
-    }
-    
-    Select {
-        width: 100%;
-        height: auto;
-        background: $surface;
-        border: solid $border;
-        padding: 1;
-    }
-    
-    Select:focus {
-        border: solid $primary;
-    }
-    
-    Button {
-        background: $surface;
-        color: $text;
-        border: solid $border;
-    }
-    
-    Button:hover {
-        background: $surface 80%;
-        border: solid $primary;
-    }
-    
-    Button.primary {
-        background: $primary 30%;
-        color: $primary;
-        border: solid $primary 60%;
-    }
-    
-    Button.primary:hover {
-        background: $primary 40%;
-    }
-    
-    Button.success {
-        background: $success 30%;
-        color: $success;
-        border: solid $success 60%;
-    }
-    
-    Button.success:hover {
-        background: $success 40%;
-    }
-    
-    Button.error {
-        background: $error 30%;
-        color: $error;
-        border: solid $error 60%;
-    }
-    
-    Button.error:hover {
-        background: $error 40%;
-    }
-    
-    Button:disabled {
-        background: $surface 20%;
-        color: $text-muted;
-        border: solid $border;
-    }
-    
-    Checkbox {
-        background: $surface;
-        color: $primary;
-    }
-    
-    Switch {
-        background: $surface;
-        color: $primary;
-    }
-    
-    Header {
-        background: $surface;
-        color: $text;
-        border-bottom: solid $border;
-    }
-    
-    Footer {
-        background: $surface;
-        color: $text;
-        border-top: solid $border;
-    }
-    """
+    CSS_PATH = "styles/tui.tcss"
     
     def __init__(self):
         """Initialize the application."""
         super().__init__()
         self.current_theme = "floorp"
+        # Screen kind -> name of the installed screen currently cached for it
+        self._screen_cache: Dict[str, str] = {}
+        # Theme name -> CSS variable rules, built on first use of the theme
+        self._theme_rule_cache: Dict[str, List[Tuple[str, str, str]]] = {}
     
     def on_mount(self) -> None:
         """Handle the mount event."""
@@ -1893,6 +1474,28 @@ class FloorperTUI(App):
         # Start with the welcome screen
         yield WelcomeScreen()
     
+    def push_cached_screen(self, kind: str, key: Hashable, factory: Callable[[], Screen]) -> None:
+        """Push a screen, reusing the installed instance when its inputs are unchanged.
+        
+        Installed screens survive being popped, so navigating back and forth
+        does not rebuild them. Only the latest screen of each kind is kept.
+        
+        Args:
+            kind: Screen kind, e.g. "options"
+            key: Hashable description of the screen's inputs
+            factory: Callable creating a new screen for this key
+        """
+        name = f"{kind}:{hash(key)}"
+        previous = self._screen_cache.get(kind)
+        
+        if previous != name:
+            if previous is not None and self.is_screen_installed(previous):
+                self.uninstall_screen(previous)
+            self.install_screen(factory(), name=name)
+            self._screen_cache[kind] = name
+        
+        self.push_screen(name)
+    
     def change_theme(self, theme_name: str) -> None:
         """Change the application theme.
         
@@ -1905,13 +1508,20 @@ class FloorperTUI(App):
         self.current_theme = theme_name
         theme = THEMES[theme_name]
         
-        # Apply theme colors
-        self.app.styles.background = theme["background"]
-        self.app.styles.color = theme["text"]
+        rules = self._theme_rule_cache.get(theme_name)
+        if rules is None:
+            rules = [("$", name, color) for name, color in theme.items()]
+            self._theme_rule_cache[theme_name] = rules
         
-        # Set CSS variables
-        for name, color in theme.items():
-            self.app.styles.set_rule(f"$", f"{name}", color)
+        # Apply theme colors and CSS variables in a single refresh
+        app = self.app
+        with self.batch_update():
+            app.styles.background = theme["background"]
+            app.styles.color = theme["text"]
+            
+            set_rule = app.styles.set_rule
+            for rule in rules:
+                set_rule(*rule)
         
         # Notify user
         self.notify(f"Theme changed to {theme_name.capitalize()}")
@@ -7,38 +7,110 @@ This module provides common utilities for the Floorper application.
 import os
 import sys
 import logging
+import functools
+import threading
 import platform
 import shutil
+import stat
 import json
 import re
+import time
+from importlib import metadata as importlib_metadata
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 # Setup logging
 logger = logging.getLogger('floorper.utils')
 
-def get_platform() -> str:
+# Matches one profiles.ini line: either a "[Section]" header (group 1), which
+# may be followed by a ";" or "#" comment, or a "key = value" pair (groups 2
+# and 3), ignoring surrounding whitespace; comment lines match neither
+_INI_RE = re.compile(
+    r'^[ \t]*(?:\[([^\]\n]*)\](?:[ \t]*[;#][^\n]*?)?|([^;#=\n][^=\n]*?)[ \t]*=[ \t]*(.*?))[ \t\r]*$',
+    re.MULTILINE
+)
+
+# JSON encoding used by load_json/save_json: orjson when installed, stdlib otherwise
+if orjson is not None:
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
+    
+    _json_loads = json.loads
+
+# Home directory, resolved once; Path.home() may fall back to a pwd lookup
+if sys.platform == 'win32':
+    _HOME_DIR = os.environ.get('USERPROFILE') or str(Path.home())
+else:
+    _HOME_DIR = os.environ.get('HOME') or os.path.expanduser('~')
+
+# Environment variable names that might contain sensitive information
+_SENSITIVE_ENV_RE = re.compile(r'key|token|secret|password|credential', re.IGNORECASE)
+
+# Interpreter version as "X.Y.Z", like platform.python_version()
+_PYTHON_VERSION = '.'.join(map(str, sys.version_info[:3]))
+
+# Units used by format_size, each 1024 times the previous one
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+
+def _detect_platform() -> str:
     """
-    Get the current platform identifier.
+    Detect the current platform identifier.
     
     Returns:
         String identifying the platform: 'windows', 'macos', 'linux', 'haiku', 'os2', or 'unknown'
     """
-    system = platform.system().lower()
-    
-    if system == 'windows' or system.startswith('win'):
+    # sys.platform is fixed at interpreter build time ('win32', 'darwin',
+    # 'linux', 'haiku1', 'os2emx', ...), so check it first and
+    # only fall back to platform.system() for anything unrecognised.
+    if sys.platform.startswith('win'):
         return 'windows'
-    elif system == 'darwin':
+    elif sys.platform == 'darwin':
         return 'macos'
-    elif system == 'linux':
+    elif sys.platform.startswith('linux'):
         return 'linux'
-    elif system == 'haiku':
+    elif sys.platform.startswith('haiku'):
         return 'haiku'
+    elif sys.platform.startswith('os2'):
+        return 'os2'
+    
+    system = platform.system().lower()
+    
+    if system.startswith('win'):
+        return 'windows'
     elif system == 'os/2' or system == 'os2':
         return 'os2'
     else:
         return 'unknown'
 
+# Platform identifier, detected once; module code compares against this directly
+_PLATFORM = _detect_platform()
+
+def get_platform() -> str:
+    """
+    Get the current platform identifier.
+    
+    Returns:
+        String identifying the platform: 'windows', 'macos', 'linux', 'haiku', 'os2', or 'unknown'
+    """
+    return _PLATFORM
+
 def get_home_dir() -> str:
     """
     Get the user's home directory in a cross-platform way.
@@ -46,8 +118,9 @@ def get_home_dir() -> str:
     Returns:
         Path to the user's home directory
     """
-    return str(Path.home())
+    return _HOME_DIR
 
+@functools.lru_cache(maxsize=8)
 def get_app_data_dir(app_name: str = 'floorper') -> str:
     """
     Get the application data directory in a cross-platform way.
@@ -58,7 +131,7 @@ def get_app_data_dir(app_name: str = 'floorper') -> str:
     Returns:
         Path to the application data directory
     """
-    platform_type = get_platform()
+    platform_type = _PLATFORM
     
     if platform_type == 'windows':
         base_dir = os.environ.get('APPDATA', os.path.join(get_home_dir(), 'AppData', 'Roaming'))
@@ -80,7 +153,9 @@ def ensure_dir_exists(directory: str) -> None:
     Args:
         directory: Path to the directory
     """
-    if not os.path.exists(directory):
+    # makedirs already tolerates an existing directory, so skip the extra
+    # stat; an empty path (a bare file name's dirname) is the current dir
+    if directory:
         os.makedirs(directory, exist_ok=True)
 
 def copy_file_safe(src: str, dst: str) -> bool:
@@ -103,6 +178,36 @@ def copy_file_safe(src: str, dst: str) -> bool:
         logger.error(f"Failed to copy file from {src} to {dst}: {str(e)}")
         return False
 
+def _copy_file_contents(src_f, dst_f) -> None:
+    """
+    Copy the rest of src_f to the current position of dst_f.
+    
+    Uses os.copy_file_range where available so the data stays in the
+    kernel, and falls back to shutil.copyfileobj otherwise.
+    
+    Args:
+        src_f: Source file object opened in binary mode
+        dst_f: Unbuffered destination file object opened in binary mode
+    """
+    if hasattr(os, 'copy_file_range'):
+        src_fd = src_f.fileno()
+        dst_fd = dst_f.fileno()
+        remaining = os.fstat(src_fd).st_size - src_f.tell()
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            return
+        except OSError:
+            # Not supported for this filesystem pair; copy the remainder
+            # from wherever the kernel left off
+            src_f.seek(os.lseek(src_fd, 0, os.SEEK_CUR))
+            dst_f.seek(os.lseek(dst_fd, 0, os.SEEK_CUR))
+    
+    shutil.copyfileobj(src_f, dst_f, 1 << 20)
+
 def merge_files(src_files: List[str], dst_file: str, append: bool = True) -> bool:
     """
     Merge multiple files into one.
@@ -119,15 +224,18 @@ def merge_files(src_files: List[str], dst_file: str, append: bool = True) -> boo
         dst_dir = os.path.dirname(dst_file)
         ensure_dir_exists(dst_dir)
         
-        mode = 'a' if append and os.path.exists(dst_file) else 'w'
+        # Opened unbuffered and positioned at the end rather than with 'a':
+        # copy_file_range refuses O_APPEND descriptors
+        mode = 'r+b' if append and os.path.exists(dst_file) else 'wb'
         
-        with open(dst_file, mode, encoding='utf-8') as dst_f:
+        with open(dst_file, mode, buffering=0) as dst_f:
+            dst_f.seek(0, os.SEEK_END)
             for src_file in src_files:
                 if os.path.exists(src_file):
-                    with open(src_file, 'r', encoding='utf-8', errors='ignore') as src_f:
-                        dst_f.write(f"\n# Merged from {os.path.basename(src_file)}\n")
-                        dst_f.write(src_f.read())
-                        dst_f.write("\n")
+                    with open(src_file, 'rb') as src_f:
+                        dst_f.write(f"\n# Merged from {os.path.basename(src_file)}\n".encode('utf-8'))
+                        _copy_file_contents(src_f, dst_f)
+                        dst_f.write(b"\n")
         
         return True
     except Exception as e:
@@ -146,8 +254,7 @@ def load_json(file_path: str) -> Optional[Dict[str, Any]]:
     """
     try:
         if os.path.exists(file_path):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_loads(Path(file_path).read_bytes())
         return None
     except Exception as e:
         logger.error(f"Failed to load JSON from {file_path}: {str(e)}")
@@ -168,8 +275,8 @@ def save_json(data: Dict[str, Any], file_path: str) -> bool:
         dst_dir = os.path.dirname(file_path)
         ensure_dir_exists(dst_dir)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        with open(file_path, 'wb') as f:
+            f.write(_json_dumps(data))
         
         return True
     except Exception as e:
@@ -189,11 +296,27 @@ def find_files(directory: str, pattern: str) -> List[str]:
     """
     result = []
     try:
+        regex = re.compile(pattern)
+        
+        def walk(path: str) -> None:
+            subdirs = []
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        # DirEntry caches the file type, so no extra stat
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif regex.search(entry.name):
+                            result.append(entry.path)
+            except OSError:
+                # Unreadable directories are skipped, as os.walk does
+                return
+            for subdir in subdirs:
+                walk(subdir)
+        
         if os.path.exists(directory):
-            for root, _, files in os.walk(directory):
-                for file in files:
-                    if re.search(pattern, file):
-                        result.append(os.path.join(root, file))
+            walk(directory)
     except Exception as e:
         logger.error(f"Error finding files in {directory} with pattern {pattern}: {str(e)}")
     
@@ -230,13 +353,14 @@ def format_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024
-        i += 1
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    
+    # Each unit is 2**10 of the previous one, so the unit index is the
+    # number of whole 10-bit groups above the lowest one
+    i = min(len(_SIZE_NAMES) - 1, (int(size_bytes).bit_length() - 1) // 10)
     
-    return f"{size_bytes:.2f} {size_names[i]}"
+    return f"{size_bytes / (1 << (10 * i)):.2f} {_SIZE_NAMES[i]}"
 
 def get_browser_icon_path(browser_id: str) -> str:
     """
@@ -252,6 +376,7 @@ def get_browser_icon_path(browser_id: str) -> str:
     # For now, we'll just return a placeholder
     return ""
 
+@functools.lru_cache(maxsize=None)
 def is_admin() -> bool:
     """
     Check if the current process has administrator/root privileges.
@@ -260,7 +385,7 @@ def is_admin() -> bool:
         True if the process has admin privileges, False otherwise
     """
     try:
-        if get_platform() == 'windows':
+        if _PLATFORM == 'windows':
             import ctypes
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
         else:
@@ -279,10 +404,9 @@ def run_as_admin(command: List[str]) -> bool:
         True if successful, False otherwise
     """
     try:
-        platform_type = get_platform()
+        platform_type = _PLATFORM
         
         if platform_type == 'windows':
-            import ctypes
             import subprocess
             
             if is_admin():
@@ -291,6 +415,7 @@ def run_as_admin(command: List[str]) -> bool:
                 return True
             else:
                 # Try to elevate privileges
+                import ctypes
                 ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, " ".join(command), None, 1)
                 return True
         else:
@@ -322,6 +447,65 @@ def get_temp_dir() -> str:
     ensure_dir_exists(temp_dir)
     return temp_dir
 
+def _copy_file(src: str, dst: str) -> None:
+    """
+    Copy a file and its metadata, like shutil.copy2.
+    
+    On Linux the data is moved with os.copy_file_range, which stays in the
+    kernel and can share extents on copy-on-write filesystems instead of
+    duplicating them. Other platforms use shutil.copy2 directly.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    if not hasattr(os, 'copy_file_range'):
+        shutil.copy2(src, dst)
+        return
+    
+    with open(src, 'rb') as src_f, open(dst, 'wb', buffering=0) as dst_f:
+        _copy_file_contents(src_f, dst_f)
+    shutil.copystat(src, dst)
+
+def _parallel_copytree(src: str, dst: str, workers: Optional[int] = None) -> None:
+    """
+    Copy a directory tree, copying files concurrently.
+    
+    Directories are created serially from a single os.walk, then every file
+    is copied with _copy_file on a thread pool. File I/O releases the GIL,
+    so profiles made of many small files copy much faster than with
+    shutil.copytree. Like copytree, dst must not already exist.
+    
+    Args:
+        src: Source directory
+        dst: Destination directory
+        workers: Number of copy threads (defaults to min(32, 4 * CPU count))
+    """
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+    
+    os.makedirs(dst)
+    dirs = [(src, dst)]
+    files = []
+    
+    for root, dir_names, file_names in os.walk(src, followlinks=True):
+        target_root = os.path.join(dst, os.path.relpath(root, src))
+        for name in dir_names:
+            target = os.path.join(target_root, name)
+            os.mkdir(target)
+            dirs.append((os.path.join(root, name), target))
+        for name in file_names:
+            files.append((os.path.join(root, name), os.path.join(target_root, name)))
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consume the results so the first failure is raised here
+        for _ in executor.map(lambda pair: _copy_file(*pair), files):
+            pass
+    
+    # Directory timestamps change while files are written, so copy them last
+    for src_dir, dst_dir in reversed(dirs):
+        shutil.copystat(src_dir, dst_dir)
+
 def create_backup(source_path: str, backup_name: Optional[str] = None) -> Optional[str]:
     """
     Create a backup of a file or directory.
@@ -353,7 +537,7 @@ def create_backup(source_path: str, backup_name: Optional[str] = None) -> Option
         
         # Create backup
         if os.path.isdir(source_path):
-            shutil.copytree(source_path, backup_path)
+            _parallel_copytree(source_path, backup_path)
         else:
             shutil.copy2(source_path, backup_path)
         
@@ -395,7 +579,7 @@ def restore_backup(backup_path: str, target_path: str) -> bool:
         
         # Restore backup
         if os.path.isdir(backup_path):
-            shutil.copytree(backup_path, target_path)
+            _parallel_copytree(backup_path, target_path)
         else:
             shutil.copy2(backup_path, target_path)
         
@@ -417,23 +601,22 @@ def list_backups() -> List[Dict[str, Any]]:
         backup_dir = os.path.join(get_app_data_dir(), 'backups')
         
         if os.path.exists(backup_dir):
-            for item in os.listdir(backup_dir):
-                item_path = os.path.join(backup_dir, item)
-                
-                # Get item info
-                stat_info = os.stat(item_path)
-                import datetime
-                
-                backup_info = {
-                    'name': item,
-                    'path': item_path,
-                    'size': get_file_size(item_path),
-                    'size_formatted': format_size(get_file_size(item_path)),
-                    'is_dir': os.path.isdir(item_path),
-                    'created': datetime.datetime.fromtimestamp(stat_info.st_ctime).strftime("%Y-%m-%d %H:%M:%S")
+            # Collect raw stat data first, then format everything in one pass
+            with os.scandir(backup_dir) as entries:
+                # One stat call provides size, type and creation time
+                raw = [(entry.name, entry.path, entry.stat()) for entry in entries]
+            
+            result = [
+                {
+                    'name': name,
+                    'path': path,
+                    'size': stat_info.st_size,
+                    'size_formatted': format_size(stat_info.st_size),
+                    'is_dir': stat.S_ISDIR(stat_info.st_mode),
+                    'created': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stat_info.st_ctime))
                 }
-                
-                result.append(backup_info)
+                for name, path, stat_info in raw
+            ]
     except Exception as e:
         logger.error(f"Failed to list backups: {str(e)}")
     
@@ -466,6 +649,80 @@ def delete_backup(backup_path: str) -> bool:
         logger.error(f"Failed to delete backup at {backup_path}: {str(e)}")
         return False
 
+def _parse_profiles_ini(profiles_ini: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parse a profiles.ini file.
+    
+    Args:
+        profiles_ini: Path to the profiles.ini file
+        
+    Returns:
+        Dictionary mapping section names to their key-value pairs, in file order
+    """
+    text = Path(profiles_ini).read_bytes().decode('utf-8', errors='ignore')
+    
+    sections = {}
+    current = None
+    
+    for section, key, value in _INI_RE.findall(text):
+        if section:
+            current = sections.setdefault(section, {})
+        elif current is not None:
+            current[key] = value
+    
+    return sections
+
+def _serialize_profiles_ini(profiles: Dict[str, Dict[str, str]]) -> str:
+    """
+    Serialize parsed profiles.ini sections back to text.
+    
+    Args:
+        profiles: Dictionary mapping section names to their key-value pairs
+        
+    Returns:
+        Contents of the profiles.ini file, with the General section first
+    """
+    sections = []
+    if 'General' in profiles:
+        sections.append('General')
+    sections.extend(section for section in profiles if section != 'General')
+    
+    lines = []
+    for section in sections:
+        lines.append(f"[{section}]")
+        lines.extend(f"{key}={value}" for key, value in profiles[section].items())
+        lines.append("")
+    
+    return "\n".join(lines) + "\n" if lines else ""
+
+def _write_profiles_ini(profiles_ini: str, profiles: Dict[str, Dict[str, str]]) -> None:
+    """
+    Atomically replace a profiles.ini file.
+    
+    The content is written and flushed to a temporary file next to
+    profiles_ini, moved into place with os.replace, and the directory is
+    synced, so an interrupted write never leaves a truncated file behind.
+    
+    Args:
+        profiles_ini: Path to the profiles.ini file
+        profiles: Dictionary mapping section names to their key-value pairs
+    """
+    tmp_path = profiles_ini + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(_serialize_profiles_ini(profiles))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, profiles_ini)
+    
+    # Persist the rename itself; directories cannot be opened on Windows
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(os.path.dirname(profiles_ini) or '.', os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+@functools.lru_cache(maxsize=None)
 def get_floorp_profiles_dir() -> str:
     """
     Get the Floorp profiles directory.
@@ -473,7 +730,7 @@ def get_floorp_profiles_dir() -> str:
     Returns:
         Path to the Floorp profiles directory
     """
-    platform_type = get_platform()
+    platform_type = _PLATFORM
     
     if platform_type == 'windows':
         return os.path.join(os.environ.get('APPDATA', ''), 'Floorp', 'Profiles')
@@ -486,6 +743,55 @@ def get_floorp_profiles_dir() -> str:
     else:  # Linux and others
         return os.path.join(get_home_dir(), '.floorp', 'Profiles')
 
+def _existing_paths(paths) -> set:
+    """
+    Return the subset of paths that exist.
+    
+    Paths are grouped by parent directory and each parent is listed once
+    with os.scandir, so the common case needs one directory read instead of
+    one stat call per path.
+    
+    Args:
+        paths: Iterable of file or directory paths
+        
+    Returns:
+        Set containing the paths that exist
+    """
+    by_parent = {}
+    for path in paths:
+        parent, name = os.path.split(path)
+        if name:
+            by_parent.setdefault(parent, []).append((name, path))
+        elif os.path.exists(path):
+            by_parent.setdefault(None, []).append((None, path))
+    
+    existing = set(path for _, path in by_parent.pop(None, ()))
+    for parent, entries in by_parent.items():
+        try:
+            with os.scandir(parent or '.') as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            existing.update(path for _, path in entries if os.path.exists(path))
+            continue
+        # Names are compared exactly; anything not listed is re-checked so
+        # case-insensitive filesystems behave as before
+        existing.update(
+            path for name, path in entries
+            if name in names or os.path.exists(path)
+        )
+    
+    return existing
+
+@functools.lru_cache(maxsize=None)
+def _get_profiles_ini_path() -> str:
+    """
+    Get the path of Floorp's profiles.ini, next to the profiles directory.
+    
+    Returns:
+        Path to profiles.ini
+    """
+    return os.path.join(os.path.dirname(get_floorp_profiles_dir()), 'profiles.ini')
+
 def get_floorp_profiles() -> List[Dict[str, Any]]:
     """
     Get available Floorp profiles.
@@ -499,61 +805,60 @@ def get_floorp_profiles() -> List[Dict[str, Any]]:
         
         if os.path.exists(profiles_dir):
             # Read profiles.ini
-            profiles_ini = os.path.join(os.path.dirname(profiles_dir), 'profiles.ini')
+            profiles_ini = _get_profiles_ini_path()
             
             if os.path.exists(profiles_ini):
                 # Parse profiles.ini
-                profiles = {}
-                current_section = None
-                
-                with open(profiles_ini, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line in f:
-                        line = line.strip()
-                        
-                        if line.startswith('[') and line.endswith(']'):
-                            # Section header
-                            current_section = line[1:-1]
-                            if current_section.startswith('Profile'):
-                                profiles[current_section] = {}
-                        elif '=' in line and current_section is not None and current_section.startswith('Profile'):
-                            # Key-value pair
-                            key, value = line.split('=', 1)
-                            profiles[current_section][key.strip()] = value.strip()
+                profiles = {
+                    section: data
+                    for section, data in _parse_profiles_ini(profiles_ini).items()
+                    if section.startswith('Profile')
+                }
                 
-                # Process profiles
+                # Resolve every profile path first so existence can be
+                # checked with one directory listing per parent
+                resolved = {}
+                profiles_root = os.path.dirname(profiles_dir)
                 for section, profile_data in profiles.items():
                     if 'Path' in profile_data:
                         path = profile_data['Path']
                         
                         # Handle relative paths
                         if not os.path.isabs(path):
-                            path = os.path.join(os.path.dirname(profiles_dir), path)
+                            path = os.path.join(profiles_root, path)
                         
-                        # Check if path exists
-                        if os.path.exists(path):
-                            profile_info = {
-                                'name': profile_data.get('Name', section),
-                                'path': path,
-                                'is_default': profile_data.get('Default', '0') == '1',
-                                'is_relative': not os.path.isabs(profile_data['Path'])
-                            }
-                            
-                            result.append(profile_info)
-            
-            # If no profiles found in profiles.ini, try to find them directly
-            if not result:
-                for item in os.listdir(profiles_dir):
-                    item_path = os.path.join(profiles_dir, item)
+                        resolved[section] = path
+                
+                existing = _existing_paths(resolved.values())
+                
+                # Process profiles
+                for section, path in resolved.items():
+                    profile_data = profiles[section]
                     
-                    if os.path.isdir(item_path) and os.path.exists(os.path.join(item_path, 'prefs.js')):
+                    # Check if path exists
+                    if path in existing:
                         profile_info = {
-                            'name': item,
-                            'path': item_path,
-                            'is_default': 'default' in item.lower(),
-                            'is_relative': False
+                            'name': profile_data.get('Name', section),
+                            'path': path,
+                            'is_default': profile_data.get('Default', '0') == '1',
+                            'is_relative': not os.path.isabs(profile_data['Path'])
                         }
                         
                         result.append(profile_info)
+            
+            # If no profiles found in profiles.ini, try to find them directly
+            if not result:
+                with os.scandir(profiles_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir() and os.path.exists(os.path.join(entry.path, 'prefs.js')):
+                            profile_info = {
+                                'name': entry.name,
+                                'path': entry.path,
+                                'is_default': 'default' in entry.name.lower(),
+                                'is_relative': False
+                            }
+                            
+                            result.append(profile_info)
     except Exception as e:
         logger.error(f"Failed to get Floorp profiles: {str(e)}")
     
@@ -606,35 +911,22 @@ def create_floorp_profile(name: str) -> Optional[Dict[str, Any]]:
             f.write('// User preferences\n')
         
         # Update profiles.ini
-        profiles_ini = os.path.join(os.path.dirname(profiles_dir), 'profiles.ini')
+        profiles_ini = _get_profiles_ini_path()
         
         # Read existing profiles.ini if it exists
-        profiles = {}
-        max_index = -1
+        try:
+            profiles = _parse_profiles_ini(profiles_ini)
+        except FileNotFoundError:
+            profiles = {}
         
-        if os.path.exists(profiles_ini):
-            current_section = None
-            
-            with open(profiles_ini, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    
-                    if line.startswith('[') and line.endswith(']'):
-                        # Section header
-                        current_section = line[1:-1]
-                        if current_section.startswith('Profile'):
-                            profiles[current_section] = {}
-                            
-                            # Extract index
-                            try:
-                                index = int(current_section[7:])
-                                max_index = max(max_index, index)
-                            except ValueError:
-                                pass
-                    elif '=' in line and current_section is not None:
-                        # Key-value pair
-                        key, value = line.split('=', 1)
-                        profiles[current_section][key.strip()] = value.strip()
+        max_index = -1
+        for section in profiles:
+            if section.startswith('Profile'):
+                # Extract index
+                try:
+                    max_index = max(max_index, int(section[7:]))
+                except ValueError:
+                    pass
         
         # Create new profile entry
         new_index = max_index + 1
@@ -648,21 +940,7 @@ def create_floorp_profile(name: str) -> Optional[Dict[str, Any]]:
         }
         
         # Write updated profiles.ini
-        with open(profiles_ini, 'w', encoding='utf-8') as f:
-            # Write General section if it exists
-            if 'General' in profiles:
-                f.write('[General]\n')
-                for key, value in profiles['General'].items():
-                    f.write(f"{key}={value}\n")
-                f.write('\n')
-            
-            # Write profile sections
-            for section, data in profiles.items():
-                if section != 'General':
-                    f.write(f"[{section}]\n")
-                    for key, value in data.items():
-                        f.write(f"{key}={value}\n")
-                    f.write('\n')
+        _write_profiles_ini(profiles_ini, profiles)
         
         # Return profile info
         return {
@@ -675,6 +953,37 @@ def create_floorp_profile(name: str) -> Optional[Dict[str, Any]]:
         logger.error(f"Failed to create Floorp profile: {str(e)}")
         return None
 
+def _find_profile_sections(profiles: Dict[str, Dict[str, str]], profile_path: str) -> List[str]:
+    """
+    Find the profiles.ini sections that refer to a profile.
+    
+    The sections are indexed by their Path value once and the target is
+    looked up both as given and relative to the profiles root, instead of
+    joining and comparing every candidate path.
+    
+    Args:
+        profiles: Parsed profiles.ini sections
+        profile_path: Absolute or profiles.ini-relative path of the profile
+        
+    Returns:
+        Names of the matching Profile sections
+    """
+    index = {}
+    for section, data in profiles.items():
+        if section.startswith('Profile') and 'Path' in data:
+            index.setdefault(data['Path'], []).append(section)
+    
+    keys = [profile_path]
+    if os.path.isabs(profile_path):
+        # profiles.ini always uses forward slashes for relative paths
+        rel_path = os.path.relpath(profile_path, os.path.dirname(get_floorp_profiles_dir()))
+        keys.append(rel_path.replace(os.sep, '/'))
+    
+    matches = []
+    for key in dict.fromkeys(keys):
+        matches.extend(index.get(key, ()))
+    return matches
+
 def set_default_floorp_profile(profile_path: str) -> bool:
     """
     Set a Floorp profile as the default.
@@ -686,77 +995,29 @@ def set_default_floorp_profile(profile_path: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        # Get profiles directory
-        profiles_dir = get_floorp_profiles_dir()
-        
         # Update profiles.ini
-        profiles_ini = os.path.join(os.path.dirname(profiles_dir), 'profiles.ini')
+        profiles_ini = _get_profiles_ini_path()
         
-        if not os.path.exists(profiles_ini):
+        # Read profiles.ini
+        try:
+            profiles = _parse_profiles_ini(profiles_ini)
+        except FileNotFoundError:
             logger.error(f"Profiles.ini not found at {profiles_ini}")
             return False
         
-        # Read profiles.ini
-        profiles = {}
-        current_section = None
-        
-        with open(profiles_ini, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                
-                if line.startswith('[') and line.endswith(']'):
-                    # Section header
-                    current_section = line[1:-1]
-                    if current_section not in profiles:
-                        profiles[current_section] = {}
-                elif '=' in line and current_section is not None:
-                    # Key-value pair
-                    key, value = line.split('=', 1)
-                    profiles[current_section][key.strip()] = value.strip()
-        
         # Find the profile and set it as default
-        target_path = profile_path
-        if os.path.isabs(profile_path):
-            # Convert to relative path if needed
-            rel_path = os.path.relpath(profile_path, os.path.dirname(profiles_dir))
-            if rel_path.startswith('Profiles/'):
-                target_path = rel_path
-        
-        found = False
+        matches = set(_find_profile_sections(profiles, profile_path))
         
         for section, data in profiles.items():
             if section.startswith('Profile'):
-                path = data.get('Path', '')
-                
-                # Check if this is the target profile
-                if path == target_path or os.path.join(os.path.dirname(profiles_dir), path) == profile_path:
-                    # Set as default
-                    profiles[section]['Default'] = '1'
-                    found = True
-                else:
-                    # Unset default
-                    profiles[section]['Default'] = '0'
-        
-        if not found:
+                data['Default'] = '1' if section in matches else '0'
+        
+        if not matches:
             logger.error(f"Profile not found: {profile_path}")
             return False
         
         # Write updated profiles.ini
-        with open(profiles_ini, 'w', encoding='utf-8') as f:
-            # Write General section if it exists
-            if 'General' in profiles:
-                f.write('[General]\n')
-                for key, value in profiles['General'].items():
-                    f.write(f"{key}={value}\n")
-                f.write('\n')
-            
-            # Write profile sections
-            for section, data in profiles.items():
-                if section != 'General':
-                    f.write(f"[{section}]\n")
-                    for key, value in data.items():
-                        f.write(f"{key}={value}\n")
-                    f.write('\n')
+        _write_profiles_ini(profiles_ini, profiles)
         
         return True
     except Exception as e:
@@ -774,9 +1035,6 @@ def delete_floorp_profile(profile_path: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        # Get profiles directory
-        profiles_dir = get_floorp_profiles_dir()
-        
         # Check if profile exists
         if not os.path.exists(profile_path):
             logger.error(f"Profile not found: {profile_path}")
@@ -786,65 +1044,21 @@ def delete_floorp_profile(profile_path: str) -> bool:
         create_backup(profile_path)
         
         # Update profiles.ini
-        profiles_ini = os.path.join(os.path.dirname(profiles_dir), 'profiles.ini')
+        profiles_ini = _get_profiles_ini_path()
         
-        if os.path.exists(profiles_ini):
-            # Read profiles.ini
-            profiles = {}
-            current_section = None
-            
-            with open(profiles_ini, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    
-                    if line.startswith('[') and line.endswith(']'):
-                        # Section header
-                        current_section = line[1:-1]
-                        if current_section not in profiles:
-                            profiles[current_section] = {}
-                    elif '=' in line and current_section is not None:
-                        # Key-value pair
-                        key, value = line.split('=', 1)
-                        profiles[current_section][key.strip()] = value.strip()
-            
+        # Read profiles.ini
+        try:
+            profiles = _parse_profiles_ini(profiles_ini)
+        except FileNotFoundError:
+            profiles = None
+        
+        if profiles is not None:
             # Find the profile and remove it
-            target_path = profile_path
-            if os.path.isabs(profile_path):
-                # Convert to relative path if needed
-                rel_path = os.path.relpath(profile_path, os.path.dirname(profiles_dir))
-                if rel_path.startswith('Profiles/'):
-                    target_path = rel_path
-            
-            sections_to_remove = []
-            
-            for section, data in profiles.items():
-                if section.startswith('Profile'):
-                    path = data.get('Path', '')
-                    
-                    # Check if this is the target profile
-                    if path == target_path or os.path.join(os.path.dirname(profiles_dir), path) == profile_path:
-                        sections_to_remove.append(section)
-            
-            # Remove sections
-            for section in sections_to_remove:
+            for section in _find_profile_sections(profiles, profile_path):
                 del profiles[section]
             
             # Write updated profiles.ini
-            with open(profiles_ini, 'w', encoding='utf-8') as f:
-                # Write General section if it exists
-                if 'General' in profiles:
-                    f.write('[General]\n')
-                    for key, value in profiles['General'].items():
-                        f.write(f"{key}={value}\n")
-                    f.write('\n')
-                
-                # Write profile sections
-                for section, data in profiles.items():
-                    if section != 'General':
-                        f.write(f"[{section}]\n")
-                        for key, value in data.items():
-                            f.write(f"{key}={value}\n")
-                        f.write('\n')
+            _write_profiles_ini(profiles_ini, profiles)
         
         # Delete profile directory
         if os.path.isdir(profile_path):
@@ -855,6 +1069,92 @@ def delete_floorp_profile(profile_path: str) -> bool:
         logger.error(f"Failed to delete Floorp profile: {str(e)}")
         return False
 
+# Common install locations for each browser on each platform, expanded once
+_BROWSER_PATHS = {
+    'floorp': {
+        'windows': [
+            os.path.expandvars(r'%ProgramFiles%\Floorp\floorp.exe'),
+            os.path.expandvars(r'%ProgramFiles(x86)%\Floorp\floorp.exe'),
+            os.path.expandvars(r'%LOCALAPPDATA%\Floorp\floorp.exe')
+        ],
+        'macos': [
+            '/Applications/Floorp.app/Contents/MacOS/floorp',
+            os.path.expanduser('~/Applications/Floorp.app/Contents/MacOS/floorp')
+        ],
+        'linux': [
+            '/usr/bin/floorp',
+            '/usr/local/bin/floorp',
+            '/opt/floorp/floorp'
+        ],
+        'haiku': [
+            '/boot/apps/Floorp/Floorp'
+        ],
+        'os2': [
+            'C:\\Floorp\\floorp.exe'
+        ]
+    },
+    'firefox': {
+        'windows': [
+            os.path.expandvars(r'%ProgramFiles%\Mozilla Firefox\firefox.exe'),
+            os.path.expandvars(r'%ProgramFiles(x86)%\Mozilla Firefox\firefox.exe'),
+            os.path.expandvars(r'%LOCALAPPDATA%\Mozilla Firefox\firefox.exe')
+        ],
+        'macos': [
+            '/Applications/Firefox.app/Contents/MacOS/firefox',
+            os.path.expanduser('~/Applications/Firefox.app/Contents/MacOS/firefox')
+        ],
+        'linux': [
+            '/usr/bin/firefox',
+            '/usr/local/bin/firefox',
+            '/opt/firefox/firefox'
+        ],
+        'haiku': [
+            '/boot/apps/Firefox/Firefox'
+        ],
+        'os2': [
+            'C:\\Mozilla\\Firefox\\firefox.exe'
+        ]
+    },
+    'chrome': {
+        'windows': [
+            os.path.expandvars(r'%ProgramFiles%\Google\Chrome\Application\chrome.exe'),
+            os.path.expandvars(r'%ProgramFiles(x86)%\Google\Chrome\Application\chrome.exe'),
+            os.path.expandvars(r'%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe')
+        ],
+        'macos': [
+            '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+            os.path.expanduser('~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome')
+        ],
+        'linux': [
+            '/usr/bin/google-chrome',
+            '/usr/local/bin/google-chrome',
+            '/opt/google/chrome/chrome'
+        ],
+        'haiku': [
+            '/boot/apps/GoogleChrome/GoogleChrome'
+        ],
+        'os2': [
+            'C:\\Google\\Chrome\\chrome.exe'
+        ]
+    }
+}
+
+@functools.lru_cache(maxsize=None)
+def _get_platform_browser_paths() -> Dict[str, Tuple[str, ...]]:
+    """
+    Get the candidate executable paths for the current platform.
+    
+    Returns:
+        Dictionary mapping browser identifiers to their paths on this platform
+    """
+    platform_type = _PLATFORM
+    return {
+        browser_id: tuple(paths[platform_type])
+        for browser_id, paths in _BROWSER_PATHS.items()
+        if platform_type in paths
+    }
+
+@functools.lru_cache(maxsize=None)
 def get_browser_executable(browser_id: str) -> Optional[str]:
     """
     Get the path to a browser executable.
@@ -865,92 +1165,60 @@ def get_browser_executable(browser_id: str) -> Optional[str]:
     Returns:
         Path to the browser executable, or None if not found
     """
-    platform_type = get_platform()
-    
-    # Define common locations for each browser on each platform
-    browser_paths = {
-        'floorp': {
-            'windows': [
-                os.path.expandvars(r'%ProgramFiles%\Floorp\floorp.exe'),
-                os.path.expandvars(r'%ProgramFiles(x86)%\Floorp\floorp.exe'),
-                os.path.expandvars(r'%LOCALAPPDATA%\Floorp\floorp.exe')
-            ],
-            'macos': [
-                '/Applications/Floorp.app/Contents/MacOS/floorp',
-                os.path.expanduser('~/Applications/Floorp.app/Contents/MacOS/floorp')
-            ],
-            'linux': [
-                '/usr/bin/floorp',
-                '/usr/local/bin/floorp',
-                '/opt/floorp/floorp'
-            ],
-            'haiku': [
-                '/boot/apps/Floorp/Floorp'
-            ],
-            'os2': [
-                'C:\\Floorp\\floorp.exe'
-            ]
-        },
-        'firefox': {
-            'windows': [
-                os.path.expandvars(r'%ProgramFiles%\Mozilla Firefox\firefox.exe'),
-                os.path.expandvars(r'%ProgramFiles(x86)%\Mozilla Firefox\firefox.exe'),
-                os.path.expandvars(r'%LOCALAPPDATA%\Mozilla Firefox\firefox.exe')
-            ],
-            'macos': [
-                '/Applications/Firefox.app/Contents/MacOS/firefox',
-                os.path.expanduser('~/Applications/Firefox.app/Contents/MacOS/firefox')
-            ],
-            'linux': [
-                '/usr/bin/firefox',
-                '/usr/local/bin/firefox',
-                '/opt/firefox/firefox'
-            ],
-            'haiku': [
-                '/boot/apps/Firefox/Firefox'
-            ],
-            'os2': [
-                'C:\\Mozilla\\Firefox\\firefox.exe'
-            ]
-        },
-        'chrome': {
-            'windows': [
-                os.path.expandvars(r'%ProgramFiles%\Google\Chrome\Application\chrome.exe'),
-                os.path.expandvars(r'%ProgramFiles(x86)%\Google\Chrome\Application\chrome.exe'),
-                os.path.expandvars(r'%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe')
-            ],
-            'macos': [
-                '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
-                os.path.expanduser('~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome')
-            ],
-            'linux': [
-                '/usr/bin/google-chrome',
-                '/usr/local/bin/google-chrome',
-                '/opt/google/chrome/chrome'
-            ],
-            'haiku': [
-                '/boot/apps/GoogleChrome/GoogleChrome'
-            ],
-            'os2': [
-                'C:\\Google\\Chrome\\chrome.exe'
-            ]
-        }
-    }
+    # Unsupported browsers and platforms have no candidate paths
+    for path in _get_platform_browser_paths().get(browser_id, ()):
+        # One stat both confirms the path exists and that it is a file
+        try:
+            if stat.S_ISREG(os.stat(path).st_mode):
+                return path
+        except OSError:
+            continue
     
-    # Check if browser is supported
-    if browser_id not in browser_paths:
-        return None
-    
-    # Check if platform is supported
-    if platform_type not in browser_paths[browser_id]:
-        return None
+    return None
+
+# posix_spawn file actions pointing the child's stdin/stdout/stderr at the null
+# device, so a launched browser cannot write over the terminal UI
+if hasattr(os, 'posix_spawn'):
+    _SPAWN_FILE_ACTIONS = [
+        (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+    ]
+
+def _spawn_detached(command: Tuple[str, ...]) -> None:
+    """
+    Start a process without waiting for it.
     
-    # Check each path
-    for path in browser_paths[browser_id][platform_type]:
-        if os.path.exists(path):
-            return path
+    On POSIX this uses os.posix_spawn, which skips subprocess's pipe setup
+    and descriptor-closing work; a daemon thread reaps the child so it does
+    not linger as a zombie. Windows starts a detached process instead.
     
-    return None
+    Args:
+        command: Executable path followed by its arguments
+    """
+    if hasattr(os, 'posix_spawn'):
+        pid = os.posix_spawn(command[0], command, os.environ, file_actions=_SPAWN_FILE_ACTIONS)
+        threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
+    elif _PLATFORM == 'windows':
+        import subprocess
+        subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=subprocess.DETACHED_PROCESS,
+        )
+    else:
+        import subprocess
+        subprocess.Popen(command)
+
+# Command-line arguments selecting a profile, formatted with the profile's
+# directory name ({name}) and full path ({path})
+_PROFILE_ARGS = {
+    'floorp': ('-P', '{name}'),
+    'firefox': ('-P', '{name}'),
+    'chrome': ('--user-data-dir={path}',)
+}
 
 def launch_browser(browser_id: str, profile_path: Optional[str] = None, url: Optional[str] = None) -> bool:
     """
@@ -972,117 +1240,122 @@ def launch_browser(browser_id: str, profile_path: Optional[str] = None, url: Opt
             logger.error(f"Browser executable not found for {browser_id}")
             return False
         
-        # Build command
-        import subprocess
-        command = [executable]
-        
-        # Add profile argument if provided
+        # Build command in one go from the browser's profile argument template
+        profile_args = ()
         if profile_path is not None:
-            if browser_id in ['floorp', 'firefox']:
-                command.extend(['-P', os.path.basename(profile_path)])
-            elif browser_id == 'chrome':
-                command.extend(['--user-data-dir=' + profile_path])
+            profile_args = tuple(
+                arg.format(name=os.path.basename(profile_path), path=profile_path)
+                for arg in _PROFILE_ARGS.get(browser_id, ())
+            )
         
-        # Add URL if provided
-        if url is not None:
-            command.append(url)
+        command = (executable, *profile_args, *(() if url is None else (url,)))
         
         # Launch browser
-        subprocess.Popen(command)
+        _spawn_detached(command)
         
         return True
     except Exception as e:
         logger.error(f"Failed to launch browser {browser_id}: {str(e)}")
         return False
 
-def get_theme_colors(theme_name: str = 'default') -> Dict[str, str]:
+# Colors shared by every theme
+_BASE_THEME_COLORS = {
+    'secondary': '#6c757d',
+    'success': '#28a745',
+    'danger': '#dc3545',
+    'warning': '#ffc107',
+    'info': '#17a2b8',
+    'light': '#f8f9fa',
+    'dark': '#343a40'
+}
+
+# Per-theme colors layered over _BASE_THEME_COLORS by _build_theme
+_THEME_OVERRIDES = {
+    'default': {
+        'primary': '#4a6ea9',
+        'background': '#ffffff',
+        'text': '#212529',
+        'link': '#007bff',
+        'border': '#dee2e6'
+    },
+    'dark': {
+        'primary': '#375a8c',
+        'background': '#121212',
+        'text': '#e0e0e0',
+        'link': '#80bdff',
+        'border': '#495057'
+    },
+    'floorp': {
+        'primary': '#4a6ea9',
+        'background': '#ffffff',
+        'text': '#212529',
+        'link': '#4a6ea9',
+        'border': '#dee2e6'
+    },
+    'floorp_dark': {
+        'primary': '#375a8c',
+        'background': '#121212',
+        'text': '#e0e0e0',
+        'link': '#80bdff',
+        'border': '#495057'
+    }
+}
+
+@functools.lru_cache(maxsize=None)
+def _build_theme(theme_name: str) -> Mapping[str, str]:
     """
-    Get color definitions for a theme.
+    Build the full palette for a theme the first time it is requested.
     
     Args:
         theme_name: Theme name
         
     Returns:
-        Dictionary with color definitions
-    """
-    # Define themes
-    themes = {
-        'default': {
-            'primary': '#4a6ea9',
-            'secondary': '#6c757d',
-            'success': '#28a745',
-            'danger': '#dc3545',
-            'warning': '#ffc107',
-            'info': '#17a2b8',
-            'light': '#f8f9fa',
-            'dark': '#343a40',
-            'background': '#ffffff',
-            'text': '#212529',
-            'link': '#007bff',
-            'border': '#dee2e6'
-        },
-        'dark': {
-            'primary': '#375a8c',
-            'secondary': '#6c757d',
-            'success': '#28a745',
-            'danger': '#dc3545',
-            'warning': '#ffc107',
-            'info': '#17a2b8',
-            'light': '#f8f9fa',
-            'dark': '#343a40',
-            'background': '#121212',
-            'text': '#e0e0e0',
-            'link': '#80bdff',
-            'border': '#495057'
-        },
-        'floorp': {
-            'primary': '#4a6ea9',
-            'secondary': '#6c757d',
-            'success': '#28a745',
-            'danger': '#dc3545',
-            'warning': '#ffc107',
-            'info': '#17a2b8',
-            'light': '#f8f9fa',
-            'dark': '#343a40',
-            'background': '#ffffff',
-            'text': '#212529',
-            'link': '#4a6ea9',
-            'border': '#dee2e6'
-        },
-        'floorp_dark': {
-            'primary': '#375a8c',
-            'secondary': '#6c757d',
-            'success': '#28a745',
-            'danger': '#dc3545',
-            'warning': '#ffc107',
-            'info': '#17a2b8',
-            'light': '#f8f9fa',
-            'dark': '#343a40',
-            'background': '#121212',
-            'text': '#e0e0e0',
-            'link': '#80bdff',
-            'border': '#495057'
-        }
-    }
+        Read-only mapping with color definitions
+        
+    Raises:
+        KeyError: If the theme does not exist
+    """
+    overrides = dict(_THEME_OVERRIDES[theme_name])
     
-    # Return theme colors
-    return themes.get(theme_name, themes['default'])
+    # Keep 'primary' first, matching the order the palettes were written in
+    return MappingProxyType({'primary': overrides.pop('primary'), **_BASE_THEME_COLORS, **overrides})
 
+def get_theme_colors(theme_name: str = 'default') -> Mapping[str, str]:
+    """
+    Get color definitions for a theme.
+    
+    Args:
+        theme_name: Theme name
+        
+    Returns:
+        Read-only mapping with color definitions
+    """
+    try:
+        return _build_theme(theme_name)
+    except KeyError:
+        return _build_theme('default')
+
+@functools.lru_cache(maxsize=1)
 def get_ui_scale_factor() -> float:
     """
     Get the UI scale factor based on the platform and screen resolution.
     
+    The value is computed once per process; on macOS it requires running
+    system_profiler, which can take around a second.
+    
     Returns:
         UI scale factor
     """
     try:
-        platform_type = get_platform()
+        platform_type = _PLATFORM
         
         if platform_type == 'windows':
             # On Windows, try to get the DPI scaling
             try:
                 import ctypes
                 user32 = ctypes.windll.user32
+                # DPI awareness is process-wide; this function is cached, so
+                # it is only set once
                 user32.SetProcessDPIAware()
                 dc = user32.GetDC(0)
                 dpi_x = ctypes.c_uint()
@@ -1106,6 +1379,7 @@ def get_ui_scale_factor() -> float:
     except Exception:
         return 1.0
 
+@functools.lru_cache(maxsize=None)
 def get_system_locale() -> str:
     """
     Get the system locale.
@@ -1119,6 +1393,7 @@ def get_system_locale() -> str:
     except Exception:
         return 'en_US'
 
+@functools.lru_cache(maxsize=None)
 def get_system_language() -> str:
     """
     Get the system language.
@@ -1147,15 +1422,49 @@ def get_translation(key: str, language: Optional[str] = None) -> str:
     # For now, we'll just return the key
     return key
 
+def _ttl_cache(seconds: float):
+    """
+    Cache the result of a function without arguments for a limited time.
+    
+    Used for system settings that rarely change during a session but
+    should still be picked up eventually. The wrapped function gains a
+    cache_clear() method, like functools.lru_cache.
+    
+    Args:
+        seconds: How long a computed value stays valid
+        
+    Returns:
+        Decorator applying the cache
+    """
+    def decorator(func):
+        state = {}
+        
+        @functools.wraps(func)
+        def wrapper():
+            now = time.monotonic()
+            if 'value' not in state or now - state['time'] > seconds:
+                state['value'] = func()
+                state['time'] = now
+            return state['value']
+        
+        wrapper.cache_clear = state.clear
+        return wrapper
+    
+    return decorator
+
+@_ttl_cache(60.0)
 def is_dark_mode_enabled() -> bool:
     """
     Check if dark mode is enabled in the system.
     
+    The result is cached for a minute, so repeated calls do not spawn
+    defaults/gsettings or query the registry each time.
+    
     Returns:
         True if dark mode is enabled, False otherwise
     """
     try:
-        platform_type = get_platform()
+        platform_type = _PLATFORM
         
         if platform_type == 'windows':
             # On Windows, check registry
@@ -1200,45 +1509,50 @@ def get_default_theme() -> str:
     else:
         return 'floorp'
 
-def get_system_fonts() -> List[str]:
+@functools.lru_cache(maxsize=1)
+def get_system_fonts() -> Tuple[str, ...]:
     """
     Get available system fonts.
     
+    Enumerating fonts takes hundreds of milliseconds on macOS and Linux,
+    so the result is computed once per process.
+    
     Returns:
-        List of font names
+        Sorted tuple of font names
     """
     try:
-        platform_type = get_platform()
+        platform_type = _PLATFORM
         
         if platform_type == 'windows':
-            # On Windows, use win32com
+            # On Windows, list the fonts folder directly
             try:
-                import win32com.client
-                shell = win32com.client.Dispatch("WScript.Shell")
-                fonts_dir = shell.SpecialFolders("Fonts")
+                fonts_dir = os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts')
                 
-                fonts = []
-                for file in os.listdir(fonts_dir):
-                    if file.endswith(('.ttf', '.ttc', '.otf')):
-                        font_name = os.path.splitext(file)[0]
-                        fonts.append(font_name)
+                # Every accepted extension is four characters long
+                with os.scandir(fonts_dir) as entries:
+                    fonts = {
+                        entry.name[:-4]
+                        for entry in entries
+                        if entry.name.lower().endswith(('.ttf', '.ttc', '.otf'))
+                    }
                 
-                return sorted(fonts)
+                return tuple(sorted(fonts))
             except Exception:
                 pass
         elif platform_type == 'macos':
             # On macOS, use system_profiler
             try:
                 import subprocess
-                result = subprocess.run(['system_profiler', 'SPFontsDataType'], capture_output=True, text=True)
+                result = subprocess.run(['system_profiler', 'SPFontsDataType'], capture_output=True)
                 
-                fonts = []
-                for line in result.stdout.splitlines():
-                    if line.strip().startswith('Full Name:'):
-                        font_name = line.split(':', 1)[1].strip()
-                        fonts.append(font_name)
+                # Work on the raw bytes and only decode the names we keep
+                fonts = [
+                    line.split(b':', 1)[1].strip().decode('utf-8', errors='replace')
+                    for line in result.stdout.split(b'\n')
+                    if line.lstrip().startswith(b'Full Name:')
+                ]
                 
-                return sorted(fonts)
+                return tuple(sorted(fonts))
             except Exception:
                 pass
         elif platform_type == 'linux':
@@ -1247,22 +1561,21 @@ def get_system_fonts() -> List[str]:
                 import subprocess
                 result = subprocess.run(['fc-list', ':', 'family'], capture_output=True, text=True)
                 
-                fonts = []
+                fonts = set()
                 for line in result.stdout.splitlines():
-                    for font in line.split(','):
-                        font = font.strip()
-                        if font and font not in fonts:
-                            fonts.append(font)
+                    fonts.update(font.strip() for font in line.split(','))
+                fonts.discard('')
                 
-                return sorted(fonts)
+                return tuple(sorted(fonts))
             except Exception:
                 pass
         
         # Default to basic fonts if detection fails
-        return ['Arial', 'Courier New', 'Times New Roman', 'Verdana']
+        return ('Arial', 'Courier New', 'Times New Roman', 'Verdana')
     except Exception:
-        return ['Arial', 'Courier New', 'Times New Roman', 'Verdana']
+        return ('Arial', 'Courier New', 'Times New Roman', 'Verdana')
 
+@functools.lru_cache(maxsize=None)
 def get_default_font() -> str:
     """
     Get the default system font.
@@ -1271,7 +1584,7 @@ def get_default_font() -> str:
         Default font name
     """
     try:
-        platform_type = get_platform()
+        platform_type = _PLATFORM
         
         if platform_type == 'windows':
             return 'Segoe UI'
@@ -1284,6 +1597,21 @@ def get_default_font() -> str:
     except Exception:
         return 'Arial'
 
+@functools.lru_cache(maxsize=1)
+def _get_uname():
+    """
+    Get platform.uname() once per process.
+    
+    The processor field may need a subprocess on some platforms, so it is
+    resolved on first use instead of at import.
+    
+    Returns:
+        platform.uname_result for this machine
+    """
+    uname = platform.uname()
+    uname.processor  # Resolve the lazily computed field now, while caching
+    return uname
+
 def get_system_info() -> Dict[str, str]:
     """
     Get system information.
@@ -1292,54 +1620,107 @@ def get_system_info() -> Dict[str, str]:
         Dictionary with system information
     """
     try:
-        import platform as plt
+        uname = _get_uname()
+        env = os.environ
         
         return {
-            'platform': get_platform(),
-            'system': plt.system(),
-            'release': plt.release(),
-            'version': plt.version(),
-            'machine': plt.machine(),
-            'processor': plt.processor(),
-            'python_version': plt.python_version(),
-            'python_implementation': plt.python_implementation(),
+            'platform': _PLATFORM,
+            'system': uname.system,
+            'release': uname.release,
+            'version': uname.version,
+            'machine': uname.machine,
+            'processor': uname.processor,
+            'python_version': _PYTHON_VERSION,
+            'python_implementation': platform.python_implementation(),
             'locale': get_system_locale(),
             'language': get_system_language(),
-            'username': os.environ.get('USER', os.environ.get('USERNAME', 'unknown')),
-            'hostname': plt.node()
+            'username': env.get('USER') or env.get('USERNAME') or 'unknown',
+            'hostname': uname.node
         }
     except Exception as e:
         logger.error(f"Failed to get system information: {str(e)}")
         return {
-            'platform': get_platform(),
+            'platform': _PLATFORM,
             'error': str(e)
         }
 
-def get_memory_usage() -> Dict[str, Union[int, str]]:
+# Process methods psutil only provides on some platforms
+_HAS_NUM_FDS = psutil is not None and hasattr(psutil.Process, 'num_fds')
+_HAS_NUM_CTX_SWITCHES = psutil is not None and hasattr(psutil.Process, 'num_ctx_switches')
+
+def _require_psutil():
+    """
+    Get the psutil module, which the system metric helpers depend on.
+    
+    Returns:
+        The psutil module
+        
+    Raises:
+        ImportError: If psutil is not installed
+    """
+    if psutil is None:
+        raise ImportError("psutil is required for system metrics")
+    return psutil
+
+@functools.lru_cache(maxsize=1)
+def _self_process(pid: int):
+    """
+    Get the psutil handle for the current process.
+    
+    Keyed on the pid so a forked child gets its own handle.
+    
+    Args:
+        pid: Current process id
+        
+    Returns:
+        psutil.Process for pid
+    """
+    return _require_psutil().Process(pid)
+
+def _size_fields(fields: List[Tuple[str, Any]], size_keys: Tuple[str, ...], formatted: bool) -> Dict[str, Any]:
+    """
+    Build a metrics dictionary, optionally adding formatted byte sizes.
+    
+    Args:
+        fields: (key, value) pairs in output order
+        size_keys: Keys whose values are byte counts
+        formatted: Whether to add a '<key>_formatted' entry after each size
+        
+    Returns:
+        Dictionary with the metrics
+    """
+    result = {}
+    for key, value in fields:
+        result[key] = value
+        if formatted and key in size_keys:
+            result[f"{key}_formatted"] = format_size(value)
+    return result
+
+def get_memory_usage(formatted: bool = True) -> Dict[str, Union[int, str]]:
     """
     Get memory usage information.
     
+    Args:
+        formatted: Whether to include human-readable '*_formatted' sizes
+        
     Returns:
         Dictionary with memory usage information
     """
     try:
-        import psutil
+        _require_psutil()
         
-        process = psutil.Process(os.getpid())
+        process = _self_process(os.getpid())
         memory_info = process.memory_info()
-        
-        return {
-            'rss': memory_info.rss,
-            'rss_formatted': format_size(memory_info.rss),
-            'vms': memory_info.vms,
-            'vms_formatted': format_size(memory_info.vms),
-            'percent': process.memory_percent(),
-            'system_total': psutil.virtual_memory().total,
-            'system_total_formatted': format_size(psutil.virtual_memory().total),
-            'system_available': psutil.virtual_memory().available,
-            'system_available_formatted': format_size(psutil.virtual_memory().available),
-            'system_percent': psutil.virtual_memory().percent
-        }
+        virtual_memory = psutil.virtual_memory()
+        
+        return _size_fields([
+            ('rss', memory_info.rss),
+            ('vms', memory_info.vms),
+            ('percent', process.memory_percent()),
+            ('system_total', virtual_memory.total),
+            ('system_available', virtual_memory.available),
+            ('system_percent', virtual_memory.percent)
+        ], ('rss', 'vms', 'system_total', 'system_available'), formatted)
     except Exception as e:
         logger.error(f"Failed to get memory usage: {str(e)}")
         return {
@@ -1357,8 +1738,6 @@ def get_disk_usage(path: str = '/') -> Dict[str, Union[int, str]]:
         Dictionary with disk usage information
     """
     try:
-        import shutil
-        
         usage = shutil.disk_usage(path)
         
         return {
@@ -1384,7 +1763,7 @@ def get_cpu_usage() -> Dict[str, Union[float, int]]:
         Dictionary with CPU usage information
     """
     try:
-        import psutil
+        _require_psutil()
         
         return {
             'percent': psutil.cpu_percent(interval=0.1),
@@ -1397,57 +1776,84 @@ def get_cpu_usage() -> Dict[str, Union[float, int]]:
             'error': str(e)
         }
 
-def get_network_info() -> Dict[str, Any]:
+# str() of each address family seen so far, see _address_family_name
+_FAMILY_NAMES: Dict[int, str] = {}
+
+def _address_family_name(family: int) -> str:
+    """
+    Get the display name of a socket address family.
+    
+    Formatting an enum member is comparatively slow and there are only a
+    handful of families, so names are computed once and remembered.
+    
+    Args:
+        family: Address family from psutil
+        
+    Returns:
+        str(family)
+    """
+    name = _FAMILY_NAMES.get(family)
+    if name is None:
+        name = _FAMILY_NAMES[family] = str(family)
+    return name
+
+def get_network_info(
+    formatted: bool = True,
+    include_connections: bool = True,
+    include_addresses: bool = True
+) -> Dict[str, Any]:
     """
     Get network information.
     
+    Args:
+        formatted: Whether to include human-readable '*_formatted' sizes
+        include_connections: Whether to count open connections; this scans
+            every socket on the system, so callers that poll may pass False
+        include_addresses: Whether to list interfaces and their addresses
+        
     Returns:
         Dictionary with network information
     """
     try:
-        import psutil
+        _require_psutil()
         
         network_info = {}
         
         # Get network interfaces
-        network_info['interfaces'] = []
-        
-        for interface, stats in psutil.net_if_addrs().items():
-            interface_info = {
-                'name': interface,
-                'addresses': []
-            }
-            
-            for addr in stats:
-                address_info = {
-                    'family': str(addr.family),
-                    'address': addr.address,
-                    'netmask': addr.netmask,
-                    'broadcast': addr.broadcast
+        if include_addresses:
+            network_info['interfaces'] = [
+                {
+                    'name': interface,
+                    'addresses': [
+                        {
+                            'family': _address_family_name(addr.family),
+                            'address': addr.address,
+                            'netmask': addr.netmask,
+                            'broadcast': addr.broadcast
+                        }
+                        for addr in stats
+                    ]
                 }
-                
-                interface_info['addresses'].append(address_info)
-            
-            network_info['interfaces'].append(interface_info)
+                for interface, stats in psutil.net_if_addrs().items()
+            ]
         
         # Get network connections
-        network_info['connections_count'] = len(psutil.net_connections())
+        if include_connections:
+            network_info['connections_count'] = len(psutil.net_connections())
         
         # Get network IO counters
         io_counters = psutil.net_io_counters()
         
-        network_info['io'] = {
-            'bytes_sent': io_counters.bytes_sent,
-            'bytes_sent_formatted': format_size(io_counters.bytes_sent),
-            'bytes_recv': io_counters.bytes_recv,
-            'bytes_recv_formatted': format_size(io_counters.bytes_recv),
-            'packets_sent': io_counters.packets_sent,
-            'packets_recv': io_counters.packets_recv,
-            'errin': io_counters.errin,
-            'errout': io_counters.errout,
-            'dropin': io_counters.dropin,
-            'dropout': io_counters.dropout
-        }
+        network_info['io'] = _size_fields([
+            ('bytes_sent', io_counters.bytes_sent),
+            ('bytes_recv', io_counters.bytes_recv),
+            ('packets_sent', io_counters.packets_sent),
+            ('packets_recv', io_counters.packets_recv),
+            ('errin', io_counters.errin),
+            ('errout', io_counters.errout),
+            ('dropin', io_counters.dropin),
+            ('dropout', io_counters.dropout)
+        ], ('bytes_sent', 'bytes_recv'), formatted)
         
         return network_info
     except Exception as e:
@@ -1464,9 +1870,8 @@ def get_process_info() -> Dict[str, Any]:
         Dictionary with process information
     """
     try:
-        import psutil
-        
-        process = psutil.Process(os.getpid())
+        process = _self_process(os.getpid())
+        memory_info = process.memory_info()
         
         return {
             'pid': process.pid,
@@ -1480,14 +1885,14 @@ def get_process_info() -> Dict[str, Any]:
             'cpu_percent': process.cpu_percent(interval=0.1),
             'memory_percent': process.memory_percent(),
             'memory_info': {
-                'rss': process.memory_info().rss,
-                'rss_formatted': format_size(process.memory_info().rss),
-                'vms': process.memory_info().vms,
-                'vms_formatted': format_size(process.memory_info().vms)
+                'rss': memory_info.rss,
+                'rss_formatted': format_size(memory_info.rss),
+                'vms': memory_info.vms,
+                'vms_formatted': format_size(memory_info.vms)
             },
             'num_threads': process.num_threads(),
-            'num_fds': process.num_fds() if hasattr(process, 'num_fds') else None,
-            'num_ctx_switches': process.num_ctx_switches() if hasattr(process, 'num_ctx_switches') else None
+            'num_fds': process.num_fds() if _HAS_NUM_FDS else None,
+            'num_ctx_switches': process.num_ctx_switches() if _HAS_NUM_CTX_SWITCHES else None
         }
     except Exception as e:
         logger.error(f"Failed to get process information: {str(e)}")
@@ -1495,6 +1900,24 @@ def get_process_info() -> Dict[str, Any]:
             'error': str(e)
         }
 
+@functools.lru_cache(maxsize=1)
+def _scan_python_packages() -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Scan installed distributions once per process.
+    
+    Returns:
+        Tuple of (name, version, location) tuples sorted by name
+    """
+    packages = {}
+    
+    for dist in importlib_metadata.distributions():
+        name = dist.metadata['Name']
+        # Like sys.path, the first distribution found for a name wins
+        if name and name.lower() not in packages:
+            packages[name.lower()] = (name, dist.version, str(dist.locate_file('')))
+    
+    return tuple(sorted(packages.values(), key=lambda x: x[0].lower()))
+
 def get_python_packages() -> List[Dict[str, str]]:
     """
     Get installed Python packages.
@@ -1503,20 +1926,10 @@ def get_python_packages() -> List[Dict[str, str]]:
         List of dictionaries with package information
     """
     try:
-        import pkg_resources
-        
-        packages = []
-        
-        for package in pkg_resources.working_set:
-            package_info = {
-                'name': package.project_name,
-                'version': package.version,
-                'location': package.location
-            }
-            
-            packages.append(package_info)
-        
-        return sorted(packages, key=lambda x: x['name'].lower())
+        return [
+            {'name': name, 'version': version, 'location': location}
+            for name, version, location in _scan_python_packages()
+        ]
     except Exception as e:
         logger.error(f"Failed to get Python packages: {str(e)}")
         return []
@@ -1530,20 +1943,15 @@ def get_environment_variables() -> Dict[str, str]:
     """
     try:
         # Filter out sensitive information
-        filtered_env = {}
-        
-        for key, value in os.environ.items():
-            # Skip keys that might contain sensitive information
-            if any(sensitive in key.lower() for sensitive in ['key', 'token', 'secret', 'password', 'credential']):
-                filtered_env[key] = '***REDACTED***'
-            else:
-                filtered_env[key] = value
-        
-        return filtered_env
+        return {
+            key: '***REDACTED***' if _SENSITIVE_ENV_RE.search(key) else value
+            for key, value in os.environ.items()
+        }
     except Exception as e:
         logger.error(f"Failed to get environment variables: {str(e)}")
         return {}
 
+@functools.lru_cache(maxsize=None)
 def get_app_version() -> str:
     """
     Get the application version.
@@ -1553,8 +1961,7 @@ def get_app_version() -> str:
     """
     try:
         # Try to get version from package metadata
-        import pkg_resources
-        return pkg_resources.get_distribution('floorper').version
+        return importlib_metadata.version('floorper')
     except Exception:
         # Fallback to hardcoded version
         return '1.0.0'
@@ -1566,6 +1973,8 @@ def get_app_info() -> Dict[str, Any]:
     Returns:
         Dictionary with application information
     """
+    uname = _get_uname()
+    
     return {
         'name': 'Floorper',
         'version': get_app_version(),
@@ -1573,11 +1982,11 @@ def get_app_info() -> Dict[str, Any]:
         'author': 'Floorper Team',
         'license': 'MIT',
         'homepage': 'https://github.com/boolforge/floorper',
-        'platform': get_platform(),
-        'python_version': platform.python_version(),
-        'system': platform.system(),
-        'release': platform.release(),
-        'machine': platform.machine()
+        'platform': _PLATFORM,
+        'python_version': _PYTHON_VERSION,
+        'system': uname.system,
+        'release': uname.release,
+        'machine': uname.machine
     }
 
 def main():
@@ -11,103 +11,223 @@ parallel processing, and other performance improvements.
 
 import os
 import sys
+import atexit
+import collections
+import copy
 import logging
+import math
+import shutil
 import time
+import zipfile
 import functools
+import hashlib
+import itertools
 import concurrent.futures
-import threading
-import multiprocessing
 from typing import Dict, List, Optional, Any, Tuple, Union, Set, Callable
 
 from floorper.core.browser_detector import BrowserDetector
+from floorper.core.constants import BROWSERS
 from floorper.core.profile_migrator import ProfileMigrator
 from floorper.core.backup_manager import BackupManager
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("performance_optimization.log")
-    ]
+logger = logging.getLogger(__name__)
+
+# Handlers and the log file are only set up for performance runs, so
+# importing the optimized classes leaves the application's logging alone
+def _setup_logging():
+    """Configure console and file logging for performance runs."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler("performance_optimization.log")
+        ]
+    )
+
+if os.environ.get("FLOORPER_PERF_LOG"):
+    _setup_logging()
+
+# Default worker count: the CPUs this process may actually run on (which
+# respects affinity masks and container CPU sets), capped to avoid
+# oversubscribing large hosts
+if hasattr(os, "sched_getaffinity"):
+    _DEFAULT_WORKERS = min(16, len(os.sched_getaffinity(0)))
+else:
+    _DEFAULT_WORKERS = min(16, os.cpu_count() or 1)
+
+# Shared thread pool, so parallel_map doesn't spawn new threads on every call
+_THREAD_POOL_SIZE = min(8, _DEFAULT_WORKERS)
+_THREAD_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=_THREAD_POOL_SIZE, thread_name_prefix="floorper-perf"
 )
+atexit.register(_THREAD_POOL.shutdown)
 
-logger = logging.getLogger(__name__)
+# Separate pool for per-file copies; these are submitted from tasks already
+# running on _THREAD_POOL, and waiting on that same pool could deadlock it
+_COPY_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=_THREAD_POOL_SIZE, thread_name_prefix="floorper-copy"
+)
+atexit.register(_COPY_POOL.shutdown)
 
-# Cache for browser detection results
-browser_detection_cache = {}
-profile_detection_cache = {}
+# Relative cost of migrating each data type, used to schedule heavy work first
+_DATA_TYPE_COSTS = {
+    "history": 8,
+    "cookies": 4,
+    "bookmarks": 4,
+    "sessions": 2,
+    "passwords": 2,
+    "extensions": 2,
+    "preferences": 1,
+}
 
-# Cache lock for thread safety
-cache_lock = threading.RLock()
+# Timing is only collected when FLOORPER_PROFILE is set
+_PROFILING_ENABLED = bool(os.environ.get("FLOORPER_PROFILE"))
 
 def timed(func):
-    """Decorator to measure function execution time."""
+    """Decorator to measure function execution time (enabled by FLOORPER_PROFILE)."""
+    if not _PROFILING_ENABLED:
+        return func
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        execution_time = end_time - start_time
-        logger.info(f"{func.__name__} executed in {execution_time:.4f} seconds")
+        if logger.isEnabledFor(logging.INFO):
+            execution_time = (time.perf_counter_ns() - start_time) / 1e9
+            logger.info(f"{func.__name__} executed in {execution_time:.4f} seconds")
         return result
     return wrapper
 
-def cached(func):
-    """Decorator to cache function results."""
-    cache = {}
+def _executor_class(mode):
+    """Return the executor class for a parallel_map/parallel_foreach mode."""
+    if mode == "thread":
+        return concurrent.futures.ThreadPoolExecutor
+    if mode == "process":
+        return concurrent.futures.ProcessPoolExecutor
+    raise ValueError(f"Unknown parallel mode: {mode}")
+
+def _map_chunk(func, chunk):
+    """Apply a function to each item of a chunk (module-level so it pickles)."""
+    return [func(item) for item in chunk]
+
+def parallel_map(func, items, max_workers=None, mode="thread"):
+    """
+    Execute a function on items in parallel.
     
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        # Create a cache key from the function arguments
-        key = str(args) + str(sorted(kwargs.items()))
-        
-        with cache_lock:
-            if key in cache:
-                logger.debug(f"Cache hit for {func.__name__} with key {key}")
-                return cache[key]
-            
-            logger.debug(f"Cache miss for {func.__name__} with key {key}")
-            result = func(*args, **kwargs)
-            cache[key] = result
-            return result
+    This is a generator: results are yielded in the order of items as they
+    become available. Items are submitted in a bounded window of chunks, so
+    neither the input nor the results are ever held in full. Wrap it in
+    list() when a list is needed.
     
-    # Add a method to clear the cache
-    wrapper.clear_cache = lambda: cache.clear()
+    Args:
+        func: Function to apply to each item
+        items: Iterable of items to process
+        max_workers: Number of workers; in thread mode the default runs
+            on the shared module pool, otherwise the usable CPU count is used
+        mode: "thread" for I/O-bound work, "process" for CPU-bound work;
+            in process mode func and items must be picklable
+        
+    Yields:
+        Results in the order of items
+    """
+    executor_class = _executor_class(mode)
     
-    return wrapper
-
-def parallel_map(func, items, max_workers=None):
-    """Execute a function on items in parallel."""
-    if not items:
-        return []
+    # Peek at the first two items without materializing the input
+    iterator = iter(items)
+    head = list(itertools.islice(iterator, 2))
+    
+    # A single item isn't worth the pool hand-off
+    if len(head) <= 1:
+        for item in head:
+            yield func(item)
+        return
+    
+    size = len(items) if hasattr(items, "__len__") else None
+    iterator = itertools.chain(head, iterator)
     
+    shared = mode == "thread" and max_workers is None
     if max_workers is None:
         # Use number of CPU cores by default
-        max_workers = multiprocessing.cpu_count()
+        max_workers = _THREAD_POOL_SIZE if shared else _DEFAULT_WORKERS
+    
+    # Batch items per worker round-trip to cut process-pool IPC overhead
+    chunksize = 1
+    if mode == "process" and size is not None:
+        chunksize = max(1, math.ceil(size / (max_workers * 4)))
+    
+    # At most this many chunks are in flight at once
+    window = max_workers * 4
+    
+    def run(executor):
+        pending = collections.deque()
+        for chunk in iter(lambda: list(itertools.islice(iterator, chunksize)), []):
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_map_chunk, func, chunk))
+        while pending:
+            yield from pending.popleft().result()
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        results = list(executor.map(func, items))
+    if shared:
+        yield from run(_THREAD_POOL)
+        return
     
-    return results
+    with executor_class(max_workers=max_workers) as executor:
+        yield from run(executor)
+
+def parallel_foreach(func, items, on_result, max_workers=None, mode="thread"):
+    """
+    Execute a function on items in parallel, handling each result as it arrives.
+    
+    Unlike parallel_map, a slow item doesn't hold back the results of the
+    items that finished before it. Results are passed to on_result in
+    completion order, on the calling thread.
+    
+    Args:
+        func: Function to apply to each item
+        items: Items to process
+        on_result: Callback invoked with each result
+        max_workers: Number of workers, as for parallel_map
+        mode: "thread" or "process", as for parallel_map
+    """
+    # A single item isn't worth the pool hand-off
+    if len(items) <= 1:
+        for item in items:
+            on_result(func(item))
+        return
+    
+    executor_class = _executor_class(mode)
+    
+    if mode == "thread" and max_workers is None:
+        futures = [_THREAD_POOL.submit(func, item) for item in items]
+        for future in concurrent.futures.as_completed(futures):
+            on_result(future.result())
+        return
+    
+    if max_workers is None:
+        max_workers = _DEFAULT_WORKERS
+    
+    with executor_class(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        for future in concurrent.futures.as_completed(futures):
+            on_result(future.result())
+
+# BrowserDetector method that parses the profiles of each browser family
+_FAMILY_PROFILE_DETECTORS = {
+    "firefox": "_detect_firefox_profiles",
+    "chrome": "_detect_chrome_profiles",
+    "safari": "_detect_safari_profiles",
+    "webkit": "_detect_webkit_profiles",
+    "text": "_detect_text_browser_profiles",
+}
+
+def _copy_profiles(profiles):
+    """Copy cached profile dicts, stats included, so callers can modify them."""
+    return [copy.deepcopy(profile) for profile in profiles]
 
 class OptimizedBrowserDetector(BrowserDetector):
     """Optimized version of BrowserDetector with caching and parallel processing."""
     
-    @cached
-    def detect_browser_from_path(self, path: str) -> Optional[str]:
-        """
-        Detect browser from a profile path with caching.
-        
-        Args:
-            path: Profile path
-            
-        Returns:
-            Optional[str]: Browser ID if detected, None otherwise
-        """
-        return super().detect_browser_from_path(path)
-    
     @timed
     def detect_all_profiles(self) -> List[Dict[str, Any]]:
         """
@@ -116,32 +236,62 @@ class OptimizedBrowserDetector(BrowserDetector):
         Returns:
             List[Dict[str, Any]]: List of detected profiles
         """
-        # Get all browser IDs
-        browser_ids = list(self.get_supported_browsers().keys())
+        # Shard the existing profile directories, rather than browsers, across
+        # workers so a browser with many profiles doesn't leave the rest idle
+        candidates = self._find_profile_dirs(list(BROWSERS))
+        
+        # Run on the shared thread pool so every directory goes through this
+        # detector's cache; parallel_map keeps the results in candidate order
+        scans = parallel_map(
+            lambda candidate: self.detect_profiles_in_path(*candidate),
+            candidates
+        )
+        
+        return _copy_profiles(itertools.chain.from_iterable(scans))
+    
+    def _find_profile_dirs(self, browser_ids: List[str]) -> List[Tuple[str, str]]:
+        """
+        List the profile directories that exist for the given browsers.
         
-        # Detect profiles for each browser in parallel
-        all_profiles = []
+        Args:
+            browser_ids: Browser identifiers
+            
+        Returns:
+            List[Tuple[str, str]]: (browser_id, expanded path) pairs
+        """
+        candidates = []
         
-        def detect_for_browser(browser_id):
-            try:
-                return self.detect_profiles(browser_id)
-            except Exception as e:
-                logger.error(f"Error detecting profiles for {browser_id}: {str(e)}")
-                return []
+        for browser_id in browser_ids:
+            for profile_path in BROWSERS.get(browser_id, {}).get("profile_paths", []):
+                expanded_path = self._expand_path(profile_path)
+                if os.path.exists(expanded_path):
+                    candidates.append((browser_id, expanded_path))
         
-        # Use parallel processing to detect profiles
-        browser_profiles = parallel_map(detect_for_browser, browser_ids)
+        return candidates
+    
+    @functools.lru_cache(maxsize=128)
+    def detect_profiles_in_path(self, browser_id: str, base_path: str) -> Tuple[Dict[str, Any], ...]:
+        """
+        Detect the profiles of one browser under a single profile directory, with caching.
         
-        # Flatten the list of profiles
-        for profiles in browser_profiles:
-            all_profiles.extend(profiles)
+        The result is shared with every later call for the same directory, so
+        it must not be modified; detect_all_profiles and detect_profiles
+        return copies.
         
-        return all_profiles
+        Args:
+            browser_id: Browser identifier
+            base_path: Expanded profile directory
+            
+        Returns:
+            Tuple[Dict[str, Any], ...]: Detected profiles
+        """
+        family = BROWSERS.get(browser_id, {}).get("family")
+        detect = getattr(self, _FAMILY_PROFILE_DETECTORS.get(family, "_detect_generic_profiles"))
+        return tuple(detect(base_path, browser_id))
     
-    @cached
     def detect_profiles(self, browser_id: str) -> List[Dict[str, Any]]:
         """
-        Detect profiles for a specific browser with caching.
+        Detect profiles for a specific browser, reusing cached directory scans.
         
         Args:
             browser_id: Browser identifier
@@ -149,11 +299,24 @@ class OptimizedBrowserDetector(BrowserDetector):
         Returns:
             List[Dict[str, Any]]: List of detected profiles
         """
-        return super().detect_profiles(browser_id)
+        return _copy_profiles(itertools.chain.from_iterable(
+            self.detect_profiles_in_path(*candidate)
+            for candidate in self._find_profile_dirs([browser_id])
+        ))
 
 class OptimizedProfileMigrator(ProfileMigrator):
     """Optimized version of ProfileMigrator with parallel processing."""
     
+    @functools.cached_property
+    def data_types(self) -> Dict[str, Any]:
+        """Supported data types, looked up once per migrator."""
+        return self._get_data_types()
+    
+    @functools.cached_property
+    def browsers(self) -> Dict[str, Any]:
+        """Supported browsers, looked up once per migrator."""
+        return self._get_browsers()
+    
     @timed
     def migrate_profile(
         self, 
@@ -194,7 +357,7 @@ class OptimizedProfileMigrator(ProfileMigrator):
         
         # Set default data types (all)
         if data_types is None:
-            data_types = list(self._get_data_types().keys())
+            data_types = list(self.data_types.keys())
         
         # Validate profiles
         if not self._validate_profile(source_profile):
@@ -229,8 +392,9 @@ class OptimizedProfileMigrator(ProfileMigrator):
         }
         
         # Migrate each data type
-        if options["parallel"] and len(data_types) > 1:
-            # Use parallel processing for multiple data types
+        if options["parallel"] and len(data_types) >= 3:
+            # Use parallel processing once there are enough data types to pay
+            # for the thread hand-off
             self._migrate_data_types_parallel(data_types, source_profile, target_profile, options, results)
         else:
             # Use sequential processing
@@ -281,21 +445,29 @@ class OptimizedProfileMigrator(ProfileMigrator):
                 logger.error(f"Error migrating {data_type}: {str(e)}")
                 return (data_type, {"success": False, "error": str(e)})
         
-        # Use parallel processing to migrate data types
-        migration_results = parallel_map(
-            migrate_data_type,
-            data_types,
-            max_workers=options.get("max_workers")
+        # Submit the most expensive data types first so the pool doesn't end
+        # up waiting on a large history import started last
+        scheduled = sorted(
+            data_types, key=lambda t: _DATA_TYPE_COSTS.get(t, 1), reverse=True
         )
         
-        # Process results
-        for data_type, migration_result in migration_results:
+        def record_result(result):
+            data_type, migration_result = result
             results["migrated_data"][data_type] = migration_result
             
             if not migration_result["success"]:
                 results["errors"].append(
                     f"Failed to migrate {data_type}: {migration_result.get('error', 'Unknown error')}"
                 )
+        
+        # Use parallel processing to migrate data types, recording each
+        # result as soon as its migration finishes
+        parallel_foreach(
+            migrate_data_type,
+            scheduled,
+            record_result,
+            max_workers=options.get("max_workers")
+        )
     
     def _migrate_data_types_sequential(
         self,
@@ -319,8 +491,10 @@ class OptimizedProfileMigrator(ProfileMigrator):
         source_family = self._get_browser_family(source_profile["browser_id"])
         target_family = self._get_browser_family(target_profile["browser_id"])
         
+        known_types = self.data_types
+        
         for data_type in data_types:
-            if data_type not in self._get_data_types():
+            if data_type not in known_types:
                 logger.warning(f"Unknown data type: {data_type}, skipping")
                 results["errors"].append(f"Unknown data type: {data_type}")
                 continue
@@ -348,6 +522,39 @@ class OptimizedProfileMigrator(ProfileMigrator):
                 results["errors"].append(f"Error migrating {data_type}: {str(e)}")
                 results["migrated_data"][data_type] = {"success": False, "error": str(e)}
     
+    def _copy_directory_files(
+        self,
+        source_dir: str,
+        target_dir: str,
+        options: Dict[str, Any],
+        result: Dict[str, Any]
+    ) -> None:
+        """
+        Copy the files of a directory in parallel, recording results serially.
+        
+        Args:
+            source_dir: Source directory
+            target_dir: Target directory
+            options: Migration options
+            result: Migration result to update
+        """
+        copies = self._list_directory_copies(source_dir, target_dir, options)
+        
+        futures = [
+            _COPY_POOL.submit(shutil.copy2, source_item, target_item)
+            for _, source_item, target_item in copies
+        ]
+        
+        # Surface the first failure as soon as it happens
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+        
+        # Record in directory order so the details read the same as a serial copy
+        for item, _, _ in copies:
+            result["migrated_items"] += 1
+            result["details"].append(f"Copied {item}")
+    
+    @functools.lru_cache(maxsize=128)
     def _get_browser_family(self, browser_id: str) -> str:
         """
         Get browser family from browser ID.
@@ -358,12 +565,48 @@ class OptimizedProfileMigrator(ProfileMigrator):
         Returns:
             str: Browser family
         """
-        browsers = self._get_browsers()
-        return browsers.get(browser_id, {}).get("family", "")
+        return self.browsers.get(browser_id, {}).get("family", "")
+
+# Files that are already compressed; deflating them again only burns CPU
+_STORED_EXTENSIONS = (
+    ".jsonlz4", ".mozlz4", ".baklz4", ".lz4",
+    ".xpi", ".crx", ".zip", ".gz", ".br",
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico",
+)
 
 class OptimizedBackupManager(BackupManager):
     """Optimized version of BackupManager with parallel processing."""
     
+    def _add_file_to_backup(self, zipf: zipfile.ZipFile, file_path: str, zip_path: str) -> str:
+        """
+        Add a profile file to a backup archive in a single read.
+        
+        The file is hashed while it is streamed into the archive, and
+        already-compressed formats are stored rather than deflated.
+        
+        Args:
+            zipf: Open backup archive
+            file_path: Path to the file
+            zip_path: Path of the file inside the archive
+            
+        Returns:
+            str: Hexadecimal SHA-256 hash of the file
+        """
+        info = zipfile.ZipInfo.from_file(file_path, zip_path)
+        if file_path.lower().endswith(_STORED_EXTENSIONS):
+            info.compress_type = zipfile.ZIP_STORED
+        else:
+            info.compress_type = zipfile.ZIP_DEFLATED
+        
+        hasher = hashlib.sha256()
+        with open(file_path, "rb") as src, \
+                zipf.open(info, "w", force_zip64=info.file_size > zipfile.ZIP64_LIMIT) as dst:
+            for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                hasher.update(chunk)
+                dst.write(chunk)
+        
+        return hasher.hexdigest()
+    
     @timed
     def create_backup(self, profile_path: str, browser_id: str, profile_name: str) -> Optional[str]:
         """
@@ -394,68 +637,57 @@ class OptimizedBackupManager(BackupManager):
         """
         return super().restore_backup(backup_path, target_path, merge)
 
-def apply_optimizations():
-    """Apply performance optimizations to Floorper."""
-    # Monkey patch the original classes with optimized versions
-    from floorper.core import browser_detector, profile_migrator, backup_manager
-    
-    # Save original classes
-    original_browser_detector = browser_detector.BrowserDetector
-    original_profile_migrator = profile_migrator.ProfileMigrator
-    original_backup_manager = backup_manager.BackupManager
-    
-    # Replace with optimized versions
-    browser_detector.BrowserDetector = OptimizedBrowserDetector
-    profile_migrator.ProfileMigrator = OptimizedProfileMigrator
-    backup_manager.BackupManager = OptimizedBackupManager
-    
-    logger.info("Applied performance optimizations to Floorper")
-    
-    # Return a function to restore original classes
-    def restore_original():
-        browser_detector.BrowserDetector = original_browser_detector
-        profile_migrator.ProfileMigrator = original_profile_migrator
-        backup_manager.BackupManager = original_backup_manager
-        logger.info("Restored original Floorper classes")
-    
-    return restore_original
+def create_optimized_components() -> Tuple[OptimizedBrowserDetector, OptimizedProfileMigrator, OptimizedBackupManager]:
+    """
+    Build the optimized detector, migrator and backup manager.
+    
+    Nothing is patched: the migrator receives the optimized backup manager
+    through its constructor, and callers pass these instances wherever they
+    would otherwise construct the core classes.
+    
+    Returns:
+        Tuple: (browser detector, profile migrator, backup manager)
+    """
+    backup_manager = OptimizedBackupManager()
+    migrator = OptimizedProfileMigrator(backup_manager=backup_manager)
+    detector = OptimizedBrowserDetector()
+    return detector, migrator, backup_manager
 
 def main():
     """Run performance optimization tests."""
-    # Apply optimizations
-    restore_original = apply_optimizations()
+    _setup_logging()
     
-    try:
-        # Run performance tests
-        print("Running performance tests with optimized classes...")
-        
-        # Test browser detection
-        detector = OptimizedBrowserDetector()
-        start_time = time.time()
-        profiles = detector.detect_all_profiles()
-        end_time = time.time()
-        
-        print(f"Detected {len(profiles)} profiles in {end_time - start_time:.4f} seconds")
-        
-        # Test cached detection (should be faster)
-        start_time = time.time()
-        profiles = detector.detect_all_profiles()
-        end_time = time.time()
-        
-        print(f"Cached detection: {len(profiles)} profiles in {end_time - start_time:.4f} seconds")
-        
-        # Clear cache and test again
-        detector.detect_all_profiles.clear_cache()
-        start_time = time.time()
-        profiles = detector.detect_all_profiles()
-        end_time = time.time()
-        
-        print(f"After cache clear: {len(profiles)} profiles in {end_time - start_time:.4f} seconds")
-        
-        print("\nPerformance optimization tests completed successfully.")
-    finally:
-        # Restore original classes
-        restore_original()
+    detector, _, _ = create_optimized_components()
+    
+    # Run performance tests
+    print("Running performance tests with optimized classes...")
+    
+    # Test browser detection
+    start_time = time.time()
+    profiles = detector.detect_all_profiles()
+    end_time = time.time()
+    
+    print(f"Detected {len(profiles)} profiles in {end_time - start_time:.4f} seconds")
+    
+    # Test cached detection (should be faster)
+    start_time = time.time()
+    profiles = detector.detect_all_profiles()
+    end_time = time.time()
+    
+    print(f"Cached detection: {len(profiles)} profiles in {end_time - start_time:.4f} seconds")
+    
+    # Clear cache and test again
+    OptimizedBrowserDetector.detect_profiles_in_path.cache_clear()
+    start_time = time.time()
+    profiles = detector.detect_all_profiles()
+    end_time = time.time()
+    
+    print(f"After cache clear: {len(profiles)} profiles in {end_time - start_time:.4f} seconds")
+    
+    # Report cache effectiveness
+    print(f"detect_profiles_in_path cache: {OptimizedBrowserDetector.detect_profiles_in_path.cache_info()}")
+    
+    print("\nPerformance optimization tests completed successfully.")
 
 if __name__ == "__main__":
     main()
@@ -18,7 +18,7 @@ with open("README.md", "r", encoding="utf-8") as fh:
 # Define package requirements
 requirements = [
     "PyQt6>=6.0.0",
-    "textual>=0.10.0",
+    "textual>=0.27.0",
     "rich>=10.0.0",
     "requests>=2.25.0",
     "pyyaml>=5.4.0",
@@ -56,7 +56,7 @@ setup(
     install_requires=[
         "click>=8.0.0",
         "rich>=12.0.0",
-        "textual>=0.10.0",
+        "textual>=0.27.0",
     ],
     extras_require={
         "dev": [
@@ -76,5 +76,8 @@ setup(
         ],
     },
     include_package_data=True,
+    package_data={
+        "floorper": ["styles/*.tcss"],
+    },
     zip_safe=False,
 )
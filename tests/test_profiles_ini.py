@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Floorper - Universal Browser Profile Migration Tool for Floorp
+
+Tests for reading, writing and searching Floorp's profiles.ini file.
+"""
+
+import os
+import sys
+import unittest
+import tempfile
+import shutil
+from unittest import mock
+
+# Add parent directory to path to import floorper modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from floorper import utils
+from floorper.utils import (
+    _parse_profiles_ini, _serialize_profiles_ini, _write_profiles_ini,
+    _find_profile_sections
+)
+
+class TestProfilesIni(unittest.TestCase):
+    """Test the profiles.ini parser, writer and section lookup."""
+
+    def setUp(self):
+        """Set up the test case."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.profiles_ini = os.path.join(self.temp_dir, 'profiles.ini')
+
+    def tearDown(self):
+        """Clean up after the test case."""
+        shutil.rmtree(self.temp_dir)
+
+    def write_raw(self, content: bytes) -> None:
+        """Write raw bytes to the test profiles.ini."""
+        with open(self.profiles_ini, 'wb') as f:
+            f.write(content)
+
+    def test_parse_basic(self):
+        """Test parsing sections and key-value pairs in file order."""
+        self.write_raw(
+            b"[General]\n"
+            b"StartWithLastProfile=1\n"
+            b"\n"
+            b"[Profile0]\n"
+            b"Name=default\n"
+            b"IsRelative=1\n"
+            b"Path=Profiles/abc.default\n"
+        )
+
+        profiles = _parse_profiles_ini(self.profiles_ini)
+
+        self.assertEqual(list(profiles), ['General', 'Profile0'])
+        self.assertEqual(profiles['General'], {'StartWithLastProfile': '1'})
+        self.assertEqual(profiles['Profile0'], {
+            'Name': 'default',
+            'IsRelative': '1',
+            'Path': 'Profiles/abc.default',
+        })
+
+    def test_parse_crlf(self):
+        """Test that CRLF line endings do not leak into names or values."""
+        self.write_raw(
+            b"[General]\r\n"
+            b"StartWithLastProfile=1\r\n"
+            b"\r\n"
+            b"[Profile0]\r\n"
+            b"Name=default\r\n"
+            b"Path=Profiles/abc.default\r\n"
+        )
+
+        profiles = _parse_profiles_ini(self.profiles_ini)
+
+        self.assertEqual(list(profiles), ['General', 'Profile0'])
+        self.assertEqual(profiles['Profile0']['Name'], 'default')
+        self.assertEqual(profiles['Profile0']['Path'], 'Profiles/abc.default')
+
+    def test_parse_value_containing_equals(self):
+        """Test that only the first '=' separates the key from the value."""
+        self.write_raw(b"[Profile0]\nName=a=b\nPath = Profiles/x=y \n")
+
+        profiles = _parse_profiles_ini(self.profiles_ini)
+
+        self.assertEqual(profiles['Profile0'], {'Name': 'a=b', 'Path': 'Profiles/x=y'})
+
+    def test_parse_comments(self):
+        """Test header lines with trailing comments and full-line comments."""
+        self.write_raw(
+            b"; written by hand\n"
+            b"[General] ; global settings\n"
+            b"StartWithLastProfile=1\n"
+            b"[Profile0]# the default profile\n"
+            b"# Name=ignored\n"
+            b"Name=default\n"
+        )
+
+        profiles = _parse_profiles_ini(self.profiles_ini)
+
+        self.assertEqual(list(profiles), ['General', 'Profile0'])
+        self.assertEqual(profiles['General'], {'StartWithLastProfile': '1'})
+        self.assertEqual(profiles['Profile0'], {'Name': 'default'})
+
+    def test_parse_ignores_keys_before_first_section(self):
+        """Test that key-value pairs outside any section are dropped."""
+        self.write_raw(b"Stray=1\n[General]\nVersion=2\n")
+
+        self.assertEqual(_parse_profiles_ini(self.profiles_ini), {'General': {'Version': '2'}})
+
+    def test_serialize_puts_general_first(self):
+        """Test that the General section is written before the profiles."""
+        text = _serialize_profiles_ini({
+            'Profile0': {'Name': 'default'},
+            'General': {'StartWithLastProfile': '1'},
+        })
+
+        self.assertEqual(text, "[General]\nStartWithLastProfile=1\n\n[Profile0]\nName=default\n\n")
+
+    def test_serialize_empty(self):
+        """Test that serializing no sections gives an empty file."""
+        self.assertEqual(_serialize_profiles_ini({}), "")
+
+    def test_round_trip(self):
+        """Test that writing parsed sections and reading them back is lossless."""
+        self.write_raw(
+            b"[General] ; comment\r\n"
+            b"StartWithLastProfile=1\r\n"
+            b"[Profile0]\r\n"
+            b"Name=a=b\r\n"
+            b"IsRelative=1\r\n"
+            b"Path=Profiles/abc.default\r\n"
+            b"[Profile1]\r\n"
+            b"Name=other\r\n"
+            b"IsRelative=0\r\n"
+            b"Path=/opt/profiles/other\r\n"
+        )
+
+        profiles = _parse_profiles_ini(self.profiles_ini)
+        _write_profiles_ini(self.profiles_ini, profiles)
+
+        self.assertEqual(_parse_profiles_ini(self.profiles_ini), profiles)
+        self.assertFalse(os.path.exists(self.profiles_ini + '.tmp'))
+
+    def test_find_profile_sections(self):
+        """Test matching sections by relative and absolute profile paths."""
+        profiles_dir = os.path.join(self.temp_dir, 'Profiles')
+        profiles = {
+            'General': {'StartWithLastProfile': '1'},
+            'Profile0': {'Name': 'default', 'IsRelative': '1', 'Path': 'Profiles/abc.default'},
+            'Profile1': {'Name': 'other', 'IsRelative': '0', 'Path': os.path.join(self.temp_dir, 'other')},
+            'Install1234': {'Default': 'Profiles/abc.default'},
+        }
+
+        with mock.patch.object(utils, 'get_floorp_profiles_dir', return_value=profiles_dir):
+            # Relative path, as written in profiles.ini
+            self.assertEqual(_find_profile_sections(profiles, 'Profiles/abc.default'), ['Profile0'])
+            # Absolute path of a relative profile
+            self.assertEqual(
+                _find_profile_sections(profiles, os.path.join(profiles_dir, 'abc.default')),
+                ['Profile0']
+            )
+            # Absolute path of an absolute profile
+            self.assertEqual(
+                _find_profile_sections(profiles, os.path.join(self.temp_dir, 'other')),
+                ['Profile1']
+            )
+            # Unknown profile
+            self.assertEqual(_find_profile_sections(profiles, os.path.join(profiles_dir, 'missing')), [])
+
+if __name__ == '__main__':
+    unittest.main()